@@ -0,0 +1,270 @@
+"""Seeded synthetic input generators for every day.
+
+Each gen_dayN(scale, seed) returns the bytes of an input file in that day's
+puzzle format. scale=1 is roughly the size of a real puzzle input and the
+input grows linearly with scale (grids grow by sqrt(scale) on each side).
+"""
+import math
+
+import numpy as np
+
+def scaled_side(base_side, scale):
+    """Side length of a square-ish grid holding scale times the base cells."""
+    return max(1, round(base_side * math.sqrt(scale)))
+
+def gen_day1(scale, seed=0):
+    """Dial rotations like 'L68' and 'R48', one per line."""
+    rng = np.random.default_rng(seed)
+    num_steps = 4500 * scale
+    directions = rng.choice([b'L', b'R'], size=num_steps)
+    counts = rng.integers(1, 1000, size=num_steps)
+    return b''.join(d + str(c).encode() + b'\n' for d, c in zip(directions, counts.tolist()))
+
+def gen_day2(scale, seed=0):
+    """Comma-separated, non-overlapping ID ranges like '11-22,95-115' on one line."""
+    rng = np.random.default_rng(seed)
+    num_ranges = 35 * scale
+    digit_lens = rng.integers(1, 11, size=num_ranges)
+    ranges = []
+    for digit_len in digit_lens.tolist():
+        low, high = 10 ** (digit_len - 1), 10 ** digit_len - 1
+        start = int(rng.integers(low, high + 1))
+        width = int(rng.integers(10, 100_000))
+        ranges.append((start, min(start + width, high)))
+
+    # Drop ranges overlapping an earlier one so every ID is listed once
+    ranges.sort()
+    disjoint = []
+    for start, end in ranges:
+        if disjoint and start <= disjoint[-1][1]:
+            continue
+        disjoint.append((start, end))
+    rng.shuffle(disjoint)
+
+    return ','.join(f'{start}-{end}' for start, end in disjoint).encode() + b'\n'
+
+def gen_day3(scale, seed=0):
+    """Battery banks: equal-length lines of digits 1-9."""
+    rng = np.random.default_rng(seed)
+    digits = rng.integers(ord('1'), ord('9') + 1, size=(200 * scale, 100), dtype=np.uint8)
+    return grid_to_bytes(digits)
+
+def gen_day4(scale, seed=0):
+    """A grid of paper rolls '@' and empty cells '.'."""
+    rng = np.random.default_rng(seed)
+    side = scaled_side(140, scale)
+    cells = np.where(rng.random((side, side)) < 0.6, ord('@'), ord('.')).astype(np.uint8)
+    return grid_to_bytes(cells)
+
+def gen_day5(scale, seed=0):
+    """Fresh ID ranges like '3-5', a blank line, then one ingredient ID per line."""
+    rng = np.random.default_rng(seed)
+    max_id = 500_000_000_000_000
+    starts = rng.integers(1, max_id, size=190 * scale)
+    widths = rng.integers(1, max_id // 1000, size=starts.size)
+    ids = rng.integers(1, max_id, size=1000 * scale)
+    ranges = ''.join(f'{s}-{s + w}\n' for s, w in zip(starts.tolist(), widths.tolist()))
+    id_lines = ''.join(f'{i}\n' for i in ids.tolist())
+    return (ranges + '\n' + id_lines).encode()
+
+def gen_day6(scale, seed=0):
+    """A worksheet of problems laid out in columns, with the operators on the last row."""
+    rng = np.random.default_rng(seed)
+    num_rows, num_problems = 4, 1000 * scale
+    rows = [[] for _ in range(num_rows)]
+    ops = []
+    for problem in range(num_problems):
+        # Shorter numbers on top keep the digits of every column contiguous
+        numbers = sorted((str(n) for n in rng.integers(1, 10 ** rng.integers(1, 5, size=num_rows))), key=len)
+        width = len(numbers[-1])
+
+        # Lines must neither start nor end with a space, the solvers strip them
+        if problem == 0:
+            right_align = False
+        elif problem == num_problems - 1:
+            right_align = True
+        else:
+            right_align = rng.random() < 0.5
+        for row, number in zip(rows, numbers):
+            row.append(number.rjust(width) if right_align else number.ljust(width))
+        ops.append(('+' if rng.random() < 0.5 else '*').ljust(width))
+
+    lines = [' '.join(row) for row in rows] + [' '.join(ops)]
+    return ('\n'.join(lines) + '\n').encode()
+
+def gen_day7(scale, seed=0):
+    """A tachyon manifold: 'S' on the top row and '^' splitters on every other row."""
+    rng = np.random.default_rng(seed)
+    num_cols = scaled_side(141, scale)
+    num_rows = scaled_side(142, scale)
+    cells = np.full((num_rows, num_cols), ord('.'), dtype=np.uint8)
+    start_col = num_cols // 2
+    cells[0, start_col] = ord('S')
+
+    # Splitters go on even rows, on the columns a beam can reach there, which
+    # alternate parity row by row just like the puzzle's triangle
+    splitters = rng.random((num_rows, num_cols)) < 0.3
+    splitters[:2] = False
+    splitters[1::2] = False
+    for row in range(2, num_rows, 2):
+        reachable_parity = (start_col + row // 2 - 1) % 2
+        splitters[row, 1 - reachable_parity::2] = False
+    splitters[2, :] = False
+    splitters[2, start_col] = True
+    cells[splitters] = ord('^')
+    return grid_to_bytes(cells)
+
+def gen_day8(scale, seed=0):
+    """Junction box coordinates like '162,817,812', one per line."""
+    rng = np.random.default_rng(seed)
+    boxes = rng.integers(0, 100_000, size=(1000 * scale, 3))
+    return ''.join(f'{x},{y},{z}\n' for x, y, z in boxes.tolist()).encode()
+
+def gen_day9(scale, seed=0):
+    """Red tiles tracing a rectilinear polygon, one 'x,y' corner per line.
+
+    The polygon is a histogram: a run of columns with random heights standing
+    on the x axis, so consecutive corners always share a row or a column.
+    """
+    rng = np.random.default_rng(seed)
+    num_columns = 250 * scale
+    xs = np.sort(rng.choice(np.arange(1, 100 * num_columns), size=num_columns + 1, replace=False))
+    heights = rng.integers(1, 100_000, size=num_columns)
+    corners = [(int(xs[0]), 0)]
+    for i, height in enumerate(heights.tolist()):
+        corners.append((int(xs[i]), height))
+        corners.append((int(xs[i + 1]), height))
+    corners.append((int(xs[-1]), 0))
+
+    # Merge consecutive equal heights away so no corner is collinear
+    polygon = []
+    for corner in corners:
+        if len(polygon) >= 2 and (polygon[-2][0] == polygon[-1][0] == corner[0] or
+                                  polygon[-2][1] == polygon[-1][1] == corner[1]):
+            polygon[-1] = corner
+        else:
+            polygon.append(corner)
+
+    return ''.join(f'{x},{y}\n' for x, y in polygon).encode()
+
+def gen_day10(scale, seed=0):
+    """Machine lines like '[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}'.
+
+    Diagrams and joltages come from real button presses, so both parts are solvable.
+    """
+    rng = np.random.default_rng(seed)
+    lines = []
+    for _ in range(170 * scale):
+        num_lights = int(rng.integers(4, 11))
+        num_buttons = int(rng.integers(4, 14))
+        buttons = set()
+        while len(buttons) < min(num_buttons, 2 ** num_lights - 1):
+            size = int(rng.integers(1, num_lights + 1))
+            buttons.add(tuple(sorted(rng.choice(num_lights, size=size, replace=False).tolist())))
+        buttons = sorted(buttons)
+        num_buttons = len(buttons)
+
+        toggled = rng.random(num_buttons) < 0.5
+        diagram = ['.'] * num_lights
+        presses = rng.integers(0, 20, size=num_buttons)
+        joltages = [0] * num_lights
+        for button, toggle, press in zip(buttons, toggled, presses.tolist()):
+            for light in button:
+                joltages[light] += press
+                if toggle:
+                    diagram[light] = '#' if diagram[light] == '.' else '.'
+
+        buttons_str = ' '.join('(' + ','.join(str(b) for b in button) + ')' for button in buttons)
+        joltages_str = ','.join(str(j) for j in joltages)
+        lines.append(f'[{"".join(diagram)}] {buttons_str} {{{joltages_str}}}')
+
+    return ('\n'.join(lines) + '\n').encode()
+
+def gen_day11(scale, seed=0):
+    """A device DAG like 'aaa: bbb ccc' with svr, fft, dac, you and out wired in.
+
+    Devices sit in layers and only connect to later layers. svr is on the first
+    layer, fft and dac a third and two thirds down, you near the end, and every
+    device except out has at least one output.
+    """
+    rng = np.random.default_rng(seed)
+    num_devices = 600 * scale
+    num_layers = 20
+    name_len = 3
+    while 26 ** name_len < 2 * num_devices:
+        name_len += 1
+    names = set()
+    while len(names) < num_devices:
+        letters = rng.integers(ord('a'), ord('z') + 1, size=name_len).astype(np.uint8)
+        names.add(letters.tobytes().decode())
+    names -= {'svr', 'fft', 'dac', 'you', 'out'}
+    names = sorted(names)
+
+    layers = [list(chunk) for chunk in np.array_split(np.array(names, dtype=object), num_layers)]
+    layers[0].append('svr')
+    layers[num_layers // 3].append('fft')
+    layers[2 * num_layers // 3].append('dac')
+    layers[num_layers - 2].append('you')
+    layers.append(['out'])
+
+    lines = []
+    for depth, layer in enumerate(layers[:-1]):
+        for device in layer:
+            num_outputs = int(rng.integers(1, 4))
+            outputs = set()
+            for _ in range(num_outputs):
+                target_layer = layers[int(rng.integers(depth + 1, min(depth + 3, len(layers))))]
+                outputs.add(target_layer[int(rng.integers(0, len(target_layer)))])
+            lines.append(f'{device}: {" ".join(sorted(outputs))}')
+    rng.shuffle(lines)
+
+    return ('\n'.join(lines) + '\n').encode()
+
+def gen_day12(scale, seed=0):
+    """Six 3x3 present shapes followed by regions like '12x5: 1 0 1 0 2 2'.
+
+    Like the real input, every region either has a 3x3 box for each of its
+    presents or fewer cells than its presents cover, so no region needs an
+    exhaustive search.
+    """
+    rng = np.random.default_rng(seed)
+    blocks = []
+    min_area = 9
+    for index in range(6):
+        shape = rng.random((3, 3)) < 0.7
+        shape[1, 1] = True
+        min_area = min(min_area, int(shape.sum()))
+        rows = [''.join('#' if cell else '.' for cell in row) for row in shape]
+        blocks.append(f'{index}:\n' + '\n'.join(rows) + '\n')
+
+    regions = []
+    for _ in range(1000 * scale):
+        width, length = (int(n) for n in rng.integers(35, 51, size=2))
+        if rng.random() < 0.5:
+            num_presents = int(rng.integers(1, (width // 3) * (length // 3) + 1))
+        else:
+            num_presents = width * length // min_area + int(rng.integers(1, 20))
+        counts = rng.multinomial(num_presents, [1 / 6] * 6)
+        regions.append(f'{width}x{length}: ' + ' '.join(str(c) for c in counts.tolist()))
+
+    return ('\n'.join(blocks) + '\n' + '\n'.join(regions) + '\n').encode()
+
+def grid_to_bytes(cells):
+    """Turn a 2d uint8 array of characters into newline-terminated lines."""
+    newlines = np.full((cells.shape[0], 1), ord('\n'), dtype=np.uint8)
+    return np.hstack([cells, newlines]).tobytes()
+
+GENERATORS = {
+    1: gen_day1,
+    2: gen_day2,
+    3: gen_day3,
+    4: gen_day4,
+    5: gen_day5,
+    6: gen_day6,
+    7: gen_day7,
+    8: gen_day8,
+    9: gen_day9,
+    10: gen_day10,
+    11: gen_day11,
+    12: gen_day12,
+}
@@ -0,0 +1,100 @@
+"""Time every solver on synthetic inputs at growing scales.
+
+For each day and scale, an input is generated with benchmarks/generators.py,
+written as dayN.txt into a temporary directory, and every part of that day is
+run against it through run_all.run_solvers.
+
+Examples:
+    python benchmarks/run_bench.py
+    python benchmarks/run_bench.py --days 1 4 --scales 10 100 --timeout 30
+    python benchmarks/run_bench.py --json bench.json --csv bench.csv
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from benchmarks.generators import GENERATORS
+import run_all
+
+DEFAULT_SCALES = [10, 100, 1000]
+BENCH_FIELDS = ['scale', 'input_bytes'] + run_all.RESULT_FIELDS
+
+def bench_day(day, scale, work_dir, seed=0, workers=None, timeout=None):
+    """Generate one day's input at the given scale and time all of its parts.
+
+    Args:
+        day (int): The day number.
+        scale (int): Input size as a multiple of the real puzzle input.
+        work_dir (str): Directory for the generated input.
+        seed (int): Seed for the input generator.
+        workers (int): Number of worker processes.
+        timeout (float): Seconds to wait for all parts of this day.
+
+    Returns:
+        A list of result dicts, one per part.
+    """
+    input_dir = os.path.join(work_dir, f'day{day:02d}_x{scale}')
+    os.makedirs(input_dir, exist_ok=True)
+    content = GENERATORS[day](scale, seed)
+    with open(os.path.join(input_dir, f'day{day}.txt'), 'wb') as file:
+        file.write(content)
+
+    tasks = [(d, part, path, input_dir) for d, part, path in run_all.discover_solvers([day])]
+    results = run_all.run_solvers(tasks, workers, timeout)
+    for result in results:
+        result['scale'] = scale
+        result['input_bytes'] = len(content)
+
+    return results
+
+def print_results(results):
+    print(f'{"day":>3} {"part":>4} {"scale":>6} {"input_bytes":>12} {"status":>7} '
+          f'{"wall_s":>10} {"cpu_s":>10} {"peak_rss_kb":>12}')
+    for result in results:
+        wall = '-' if result['wall_s'] is None else f'{result["wall_s"]:.4f}'
+        cpu = '-' if result['cpu_s'] is None else f'{result["cpu_s"]:.4f}'
+        rss = '-' if result['peak_rss_kb'] is None else str(result['peak_rss_kb'])
+        print(f'{result["day"]:>3} {result["part"]:>4} {result["scale"]:>6} {result["input_bytes"]:>12} '
+              f'{result["status"]:>7} {wall:>10} {cpu:>10} {rss:>12}')
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark all solvers on scaled synthetic inputs.')
+    parser.add_argument('--days', type=int, nargs='*', help='Days to run, e.g. --days 1 7. Default: all')
+    parser.add_argument('--scales', type=int, nargs='*', default=DEFAULT_SCALES, help='Input scales, default: 10 100 1000')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the input generators')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes. Default: number of cores')
+    parser.add_argument('--timeout', type=float, default=60, help='Seconds to wait for each day at each scale')
+    parser.add_argument('--keep-inputs', help='Write the generated inputs to this directory instead of a temp one')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    parser.add_argument('--csv', help='Write the results to this CSV file')
+    args = parser.parse_args()
+
+    # Generated inputs replace dayN.txt, so demo mode must be off
+    os.environ['demo'] = '0'
+
+    days = args.days or sorted(GENERATORS)
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = args.keep_inputs or temp_dir
+        for day in days:
+            for scale in args.scales:
+                print(f'Running day {day} at {scale}x...', flush=True)
+                results.extend(bench_day(day, scale, work_dir, args.seed, args.workers, args.timeout))
+
+    print_results(results)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+    if args.csv:
+        with open(args.csv, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=BENCH_FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+
+if __name__ == '__main__':
+    main()
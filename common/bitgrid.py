@@ -0,0 +1,154 @@
+"""Bit-packed boolean grid shared by the grid puzzles.
+
+Every row is one Python int with bit c set when column c is on, so a grid costs
+one bit per cell instead of a one-character str per cell. Whole rows are
+combined with &, |, ^ and shifts, which makes neighbor tests and beam sweeps a
+handful of big-int operations per row instead of a Python loop per cell.
+"""
+import numpy as np
+
+from common.input_loader import open_input
+
+class BitGrid:
+    """A num_rows x num_cols grid of bits, one int per row.
+
+    Bits beyond num_cols are always clear, every method that shifts a row
+    masks it back to the grid width.
+    """
+
+    def __init__(self, num_rows, num_cols, rows=None):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.mask = (1 << num_cols) - 1
+        if rows is None:
+            self.rows = [0] * num_rows
+        else:
+            self.rows = [row & self.mask for row in rows]
+            if len(self.rows) != num_rows:
+                raise ValueError(f'Expected {num_rows} rows, got {len(self.rows)}')
+
+    @staticmethod
+    def line_to_bits(line, on):
+        """Pack one line into an int with bit c set where line[c] is one of the on characters.
+
+        Args:
+            line (str or bytes-like): The characters of the row.
+            on (str or bytes): The characters that count as set bits, e.g. '@'.
+
+        Returns:
+            The row as an int.
+        """
+        if isinstance(line, str):
+            line = line.encode()
+        if isinstance(on, str):
+            on = on.encode()
+        bits = np.isin(np.frombuffer(line, dtype=np.uint8), np.frombuffer(on, dtype=np.uint8))
+        return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+    @classmethod
+    def from_lines(cls, lines, on):
+        """Build a grid from text lines, shorter lines are padded with clear bits."""
+        lines = list(lines)
+        num_cols = max((len(line) for line in lines), default=0)
+        return cls(len(lines), num_cols, [cls.line_to_bits(line, on) for line in lines])
+
+    @classmethod
+    def from_array(cls, array):
+        """Build a grid from a 2d bool numpy array."""
+        array = np.asarray(array, dtype=bool)
+        num_rows, num_cols = array.shape
+        packed = np.packbits(array, axis=1, bitorder='little')
+        return cls(num_rows, num_cols, [int.from_bytes(row.tobytes(), 'little') for row in packed])
+
+    @classmethod
+    def from_file(cls, filename, on):
+        """Load a grid straight from the puzzle input (demo.txt in demo mode).
+
+        Rows are packed from the memory-mapped file without building a str per
+        line. Trailing blank lines are not part of the grid.
+        """
+        with open_input(filename) as buffer:
+            grid = cls.from_array(np.isin(buffer.grid(), np.frombuffer(on.encode(), dtype=np.uint8)))
+        return grid
+
+    def to_array(self):
+        """Unpack the grid into a 2d bool numpy array."""
+        num_bytes = (self.num_cols + 7) // 8
+        packed = np.frombuffer(
+            b''.join(row.to_bytes(num_bytes, 'little') for row in self.rows), dtype=np.uint8)
+        bits = np.unpackbits(packed.reshape(self.num_rows, num_bytes), axis=1, bitorder='little')
+        return bits[:, :self.num_cols].astype(bool)
+
+    def copy(self):
+        return BitGrid(self.num_rows, self.num_cols, self.rows)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.num_rows and 0 <= col < self.num_cols
+
+    def get(self, row, col):
+        return (self.rows[row] >> col) & 1 == 1
+
+    def set(self, row, col):
+        self.rows[row] |= 1 << col
+
+    def clear(self, row, col):
+        self.rows[row] &= ~(1 << col)
+
+    def row(self, row):
+        """Get a row as an int, 0 for rows outside the grid."""
+        if 0 <= row < self.num_rows:
+            return self.rows[row]
+        return 0
+
+    def column(self, col):
+        """Get a column as an int with bit r set when (r, col) is set."""
+        bits = 0
+        for row in reversed(self.rows):
+            bits = (bits << 1) | ((row >> col) & 1)
+        return bits
+
+    def shift(self, bits, offset):
+        """Move the bits of a row by offset columns (positive is to the right), dropping overflow."""
+        if offset >= 0:
+            return (bits << offset) & self.mask
+        return bits >> -offset
+
+    def invert(self, bits):
+        """Flip the bits of a row within the grid width."""
+        return ~bits & self.mask
+
+    def row_popcount(self, row):
+        return self.rows[row].bit_count()
+
+    def popcount(self):
+        """Count the set bits of the whole grid."""
+        return sum(row.bit_count() for row in self.rows)
+
+    def iter_cells(self, value=True):
+        """Yield the (row, col) of every set cell, or of every clear cell when value is False."""
+        for row_idx, row in enumerate(self.rows):
+            bits = row if value else self.invert(row)
+            while bits:
+                low = bits & -bits
+                yield row_idx, low.bit_length() - 1
+                bits ^= low
+
+    def fits(self, other, row, col):
+        """Check if other, with its top-left corner at (row, col), lies inside this grid on clear bits only."""
+        if row < 0 or col < 0 or row + other.num_rows > self.num_rows or col + other.num_cols > self.num_cols:
+            return False
+        return not any((bits << col) & self.rows[row + i] for i, bits in enumerate(other.rows))
+
+    def paste(self, other, row, col):
+        """Set the bits of other with its top-left corner at (row, col)."""
+        for i, bits in enumerate(other.rows):
+            self.rows[row + i] |= (bits << col) & self.mask
+
+    def erase(self, other, row, col):
+        """Clear the bits of other with its top-left corner at (row, col)."""
+        for i, bits in enumerate(other.rows):
+            self.rows[row + i] &= ~(bits << col)
+
+    def __str__(self):
+        return '\n'.join(
+            ''.join('#' if (row >> col) & 1 else '.' for col in range(self.num_cols)) for row in self.rows)
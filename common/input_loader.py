@@ -0,0 +1,275 @@
+"""Shared puzzle input loading for every day.
+
+The puzzle input (or ``demo.txt`` when the ``demo`` environment variable is set)
+is memory-mapped once and handed out as views over the raw bytes: line views,
+integer columns and 2d grids. Nothing here builds a list of ``str`` objects
+except the ``get_lines``/``get_content`` helpers kept for the older solvers.
+"""
+import mmap
+import os
+
+import numpy as np
+
+DEMO_FILENAME = 'demo.txt'
+
+# Longest digit run that still fits in an int64
+MAX_INT64_DIGITS = 18
+
+# Bytes read at a time by the streaming readers
+STREAM_CHUNK_BYTES = 1 << 24
+
+DIGITS = b'0123456789'
+
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+
+
+def get_env_int(name, default=0):
+    """Read an integer setting from the environment, e.g. demo=1 or workers=8."""
+    value = os.getenv(name, '').strip()
+    if not value:
+        return default
+    return int(value)
+
+
+def is_demo_mode():
+    """Check if the demo input should be used instead of the puzzle input."""
+    return get_env_int('demo') != 0
+
+
+def resolve_input_path(filename):
+    """Get the file to read: the puzzle input or demo.txt in demo mode."""
+    if is_demo_mode():
+        return DEMO_FILENAME
+    return filename
+
+
+def parse_ints(buffer):
+    """Parse every unsigned integer in a bytes-like buffer in one vectorized pass.
+
+    Any non-digit byte is a separator, so '3-5', '162,817,812' and 'L68' all work.
+
+    Args:
+        buffer: A bytes-like object or a uint8 numpy array.
+
+    Returns:
+        A 1d int64 numpy array of the integers in order of appearance.
+    """
+    if isinstance(buffer, np.ndarray):
+        data = buffer
+    else:
+        data = np.frombuffer(buffer, dtype=np.uint8)
+    if data.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    is_digit = (data >= ord('0')) & (data <= ord('9'))
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if starts.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    lengths = ends - starts
+    if lengths.max() > MAX_INT64_DIGITS:
+        raise ValueError(f'Integer with more than {MAX_INT64_DIGITS} digits does not fit in int64')
+
+    # Each digit is weighted by 10 ** (number of digits after it in its run)
+    digit_idx = np.flatnonzero(is_digit)
+    run_ends = np.repeat(ends, lengths)
+    powers = np.power(10, run_ends - digit_idx - 1, dtype=np.int64)
+    weighted = (data[digit_idx].astype(np.int64) - ord('0')) * powers
+    run_starts_in_digits = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    return np.add.reduceat(weighted, run_starts_in_digits)
+
+
+def iter_int_chunks(file, chunk_bytes=STREAM_CHUNK_BYTES):
+    """Yield the unsigned integers of a binary file chunk by chunk without reading it all.
+
+    Every block is cut after its last non-digit byte, so no integer is split
+    between two chunks.
+
+    Args:
+        file: A file opened in binary mode, read from its current position.
+        chunk_bytes (int): Number of bytes read at a time.
+
+    Yields:
+        1d int64 numpy arrays, see parse_ints.
+    """
+    tail = b''
+    while True:
+        block = file.read(chunk_bytes)
+        if not block:
+            break
+        block = tail + block
+        complete = block.rstrip(DIGITS)
+        tail = block[len(complete):]
+        numbers = parse_ints(complete)
+        if numbers.size:
+            yield numbers
+
+    if tail:
+        yield parse_ints(tail)
+
+
+class InputBuffer:
+    """A read-only, memory-mapped puzzle input.
+
+    Views handed out by this class (memoryviews and numpy arrays) point straight
+    into the mapping, so they stay valid for as long as they are referenced.
+    """
+
+    def __init__(self, filename):
+        self.path = filename
+        self._file = open(filename, 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b''  # mmap cannot map an empty file
+        self.data = memoryview(self._map)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.data)
+
+    def close(self):
+        """Release the mapping if no view into it is still alive."""
+        self.data.release()
+        try:
+            if isinstance(self._map, mmap.mmap):
+                self._map.close()
+        except BufferError:
+            pass  # A numpy array or line view still uses it, let GC unmap it
+        self._file.close()
+
+    def as_array(self):
+        """Get the whole file as a uint8 numpy array without copying."""
+        return np.frombuffer(self._map, dtype=np.uint8)
+
+    def line_bounds(self):
+        """Get the start and end (exclusive) offsets of every line.
+
+        Line terminators ('\\n' and a trailing '\\r') are excluded from the bounds,
+        and a final newline does not produce an extra empty line.
+
+        Returns:
+            A tuple (starts, ends) of int64 numpy arrays.
+        """
+        data = self.as_array()
+        newlines = np.flatnonzero(data == NEWLINE)
+        ends = newlines
+        if data.size and data[-1] != NEWLINE:
+            ends = np.append(newlines, data.size)
+        starts = np.concatenate(([0], newlines + 1))[:ends.size]
+
+        # Drop the '\r' of Windows line endings
+        has_cr = (ends > starts) & (data[np.maximum(ends - 1, 0)] == CARRIAGE_RETURN)
+        ends = ends - has_cr
+
+        return starts.astype(np.int64), ends.astype(np.int64)
+
+    def iter_lines(self):
+        """Yield a memoryview over each line, without the line terminator."""
+        data = self.data
+        size = len(data)
+        pos = 0
+        while pos < size:
+            end = self._map.find(b'\n', pos)
+            if end == -1:
+                end = size
+            line_end = end
+            if line_end > pos and data[line_end - 1] == CARRIAGE_RETURN:
+                line_end -= 1
+            yield data[pos:line_end]
+            pos = end + 1
+
+    def ints(self):
+        """Get every unsigned integer in the file as a flat int64 array."""
+        return parse_ints(self.as_array())
+
+    def int_columns(self, num_cols):
+        """Get the integers of a file like '162,817,812' as a 2d int64 array.
+
+        Args:
+            num_cols (int): Number of integers on each line.
+
+        Returns:
+            A numpy array with one row per line and num_cols columns.
+        """
+        numbers = self.ints()
+        if numbers.size % num_cols != 0:
+            raise ValueError(f'{numbers.size} integers cannot be split into rows of {num_cols}')
+
+        return numbers.reshape(-1, num_cols)
+
+    def grid(self):
+        """Get a rectangular character grid as a 2d uint8 array.
+
+        The array is a strided view into the mapping when every line has the same
+        length and line terminator, otherwise the rows are copied and padded
+        with spaces.
+
+        Returns:
+            A numpy array of shape (num_rows, num_cols).
+        """
+        starts, ends = self.line_bounds()
+        if starts.size == 0:
+            return np.zeros((0, 0), dtype=np.uint8)
+
+        # Trailing blank lines are not part of the grid
+        non_empty = np.flatnonzero(ends > starts)
+        last = non_empty[-1] + 1 if non_empty.size else 0
+        starts, ends = starts[:last], ends[:last]
+        if starts.size == 0:
+            return np.zeros((0, 0), dtype=np.uint8)
+
+        data = self.as_array()
+        widths = ends - starts
+        num_cols = int(widths.max())
+        if starts.size > 1:
+            strides = np.diff(starts)
+            stride = int(strides[0])
+        else:
+            stride = num_cols
+        if (widths == num_cols).all() and (starts.size == 1 or (strides == stride).all()):
+            return np.lib.stride_tricks.as_strided(
+                data[starts[0]:],
+                shape=(starts.size, num_cols),
+                strides=(stride, 1),
+                writeable=False,
+            )
+
+        grid = np.full((starts.size, num_cols), ord(' '), dtype=np.uint8)
+        for row, (start, end) in enumerate(zip(starts, ends)):
+            grid[row, :end - start] = data[start:end]
+
+        return grid
+
+
+def open_input(filename):
+    """Memory-map the puzzle input, or demo.txt in demo mode."""
+    return InputBuffer(resolve_input_path(filename))
+
+
+def get_lines(filename):
+    """Get the stripped lines of the puzzle input as a list of strings."""
+    try:
+        with open_input(filename) as buffer:
+            return [bytes(line).decode().strip() for line in buffer.iter_lines()]
+    except Exception as e:
+        print(f'File read operation exception happened. See details: {e}')
+        return []
+
+
+def get_content(filename):
+    """Get the whole puzzle input as a string."""
+    try:
+        with open_input(filename) as buffer:
+            return bytes(buffer.data).decode()
+    except Exception as e:
+        print(f'file reading error. See details {e}')
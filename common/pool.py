@@ -0,0 +1,23 @@
+"""Process pool fan-out shared by the solvers with a workers=N mode."""
+import multiprocessing
+
+def run_tasks(func, tasks, workers=1):
+    """Call func(*task) for every task, spread over a pool of worker processes.
+
+    Runs everything in this process for workers <= 1, for a single task, and
+    inside a daemonic process, which is not allowed to start a pool.
+
+    Args:
+        func (callable): A module-level function, so it can be sent to the workers.
+        tasks (list): The argument tuples, one per call.
+        workers (int): Number of worker processes.
+
+    Returns:
+        A list with the result of each task, in the same order as tasks.
+    """
+    if workers <= 1 or len(tasks) <= 1 or multiprocessing.current_process().daemon:
+        return [func(*task) for task in tasks]
+
+    with multiprocessing.Pool(workers) as pool:
+        tasks_per_batch = max(1, len(tasks) // (workers * 4))
+        return pool.starmap(func, tasks, chunksize=tasks_per_batch)
@@ -0,0 +1,198 @@
+"""Dial engine shared by both day01 parts.
+
+Steps are signed integers (L68 -> -68, R48 -> 48). With the unbounded position
+p = start + (sum of the steps so far), a step from a to b lands on zero when
+b % size == 0, and passes zero
+
+    b // size - a // size                  when turning right, and
+    (a - 1) // size - (b - 1) // size      when turning left,
+
+so a whole stream of steps is counted with one cumulative sum and a few
+floor divisions, no per-step branching.
+"""
+import itertools
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.input_loader import parse_ints, resolve_input_path
+
+DIAL_SIZE = 100
+STREAM_CHUNK_LINES = 1 << 20
+
+# Upper bound on the (steps x dials) block simulate_dials works on at once
+BATCH_BLOCK_CELLS = 1 << 22
+
+def parse_steps(data):
+    """Parse rotation lines like 'L68' into signed steps.
+
+    Args:
+        data: A bytes-like object or uint8 numpy array holding whole lines.
+
+    Returns:
+        A 1d int64 numpy array, negative for 'L' and positive for 'R'.
+    """
+    if not isinstance(data, np.ndarray):
+        data = np.frombuffer(data, dtype=np.uint8)
+
+    # The direction is the first byte of every non-empty line
+    line_starts = np.concatenate(([0], np.flatnonzero(data == ord('\n')) + 1))
+    line_starts = line_starts[line_starts < data.size]
+    directions = data[line_starts]
+    directions = directions[(directions == ord('L')) | (directions == ord('R'))]
+
+    counts = parse_ints(data)
+    if counts.size != directions.size:
+        raise ValueError(f'Found {directions.size} directions but {counts.size} step counts')
+
+    return np.where(directions == ord('L'), -counts, counts)
+
+def get_steps(lines):
+    """Get the steps for unlocking the safe.
+
+    Args:
+        lines (list): Input lines from the text file, e.g. ['L68', 'R48'].
+
+    Returns:
+        A 1d int64 numpy array of signed steps, e.g. [-68, 48].
+    """
+    return parse_steps('\n'.join(lines).encode())
+
+def get_steps_from_buffer(buffer):
+    """Get the signed steps straight from a memory-mapped InputBuffer."""
+    return parse_steps(buffer.as_array())
+
+def count_zeros(steps, start_num, dial_size=DIAL_SIZE):
+    """Count how often the dial lands on zero and passes zero.
+
+    Args:
+        steps (ndarray): Signed steps, see get_steps.
+        start_num (int): The start number on the dial.
+        dial_size (int): How many numbers are on the dial.
+
+    Returns:
+        A tuple (landings, passes, end_num). landings counts steps ending on zero,
+        passes counts every click through zero including the landings.
+    """
+    if steps.size == 0:
+        return 0, 0, start_num % dial_size
+
+    positions = start_num + np.cumsum(steps)
+    befores = np.concatenate(([start_num], positions[:-1]))
+
+    landings = np.count_nonzero(positions % dial_size == 0)
+    right_passes = positions // dial_size - befores // dial_size
+    left_passes = (befores - 1) // dial_size - (positions - 1) // dial_size
+    passes = np.where(steps >= 0, right_passes, left_passes).sum()
+
+    return int(landings), int(passes), int(positions[-1] % dial_size)
+
+def simulate_dials(steps, start_nums, dial_sizes=DIAL_SIZE, block_cells=BATCH_BLOCK_CELLS):
+    """Run one parsed rotation log against many dials in one vectorized pass.
+
+    The cumulative sum of the steps is computed once and shared by every dial,
+    each dial only adds its own start number and divides by its own size.
+
+    Args:
+        steps (ndarray): Signed steps, see get_steps.
+        start_nums (array_like): Start number of each dial.
+        dial_sizes (array_like): Size of each dial, or one size for all dials.
+        block_cells (int): Max number of (step, dial) cells evaluated at once.
+
+    Returns:
+        A tuple (landings, passes) of int64 arrays with one entry per dial.
+    """
+    start_nums, dial_sizes = np.broadcast_arrays(
+        np.asarray(start_nums, dtype=np.int64), np.asarray(dial_sizes, dtype=np.int64))
+    start_nums, dial_sizes = start_nums.ravel(), dial_sizes.ravel()
+    num_dials = start_nums.size
+    landings = np.zeros(num_dials, dtype=np.int64)
+    passes = np.zeros(num_dials, dtype=np.int64)
+    if steps.size == 0 or num_dials == 0:
+        return landings, passes
+
+    # Offsets from the start number before and after every step
+    offsets_after = np.cumsum(steps)
+    offsets_before = np.concatenate(([0], offsets_after[:-1]))
+    turns_right = (steps >= 0)[:, None]
+
+    block_steps = min(steps.size, max(1, block_cells))
+    block_dials = max(1, block_cells // block_steps)
+    for row in range(0, steps.size, block_steps):
+        rows = slice(row, row + block_steps)
+        for col in range(0, num_dials, block_dials):
+            cols = slice(col, col + block_dials)
+            starts, sizes = start_nums[cols], dial_sizes[cols]
+            positions = starts + offsets_after[rows, None]
+            befores = starts + offsets_before[rows, None]
+
+            landings[cols] += np.count_nonzero(positions % sizes == 0, axis=0)
+            right_passes = positions // sizes - befores // sizes
+            left_passes = (befores - 1) // sizes - (positions - 1) // sizes
+            passes[cols] += np.where(turns_right[rows], right_passes, left_passes).sum(axis=0)
+
+    return landings, passes
+
+class Dial:
+    """A dial that is turned by chunks of steps, for streams too big for memory.
+
+    Only the current number and the two counters are kept between chunks.
+    """
+
+    def __init__(self, start_num, dial_size=DIAL_SIZE, verbose=False):
+        self.num = start_num % dial_size
+        self.dial_size = dial_size
+        self.verbose = verbose
+        self.landings = 0
+        self.passes = 0
+
+    def turn(self, steps):
+        """Turn the dial by a chunk of signed steps and update the counters."""
+        if self.verbose:
+            self._print_steps(steps)
+
+        landings, passes, self.num = count_zeros(steps, self.num, self.dial_size)
+        self.landings += landings
+        self.passes += passes
+
+    def _print_steps(self, steps):
+        """Print every step the way the old per-step loop did. Slow, for debugging only."""
+        num, passes = self.num, self.passes
+        for step in steps.tolist():
+            direction = 'L' if step < 0 else 'R'
+            print(f'before -- number is {num}, turn is {direction}, {abs(step)}')
+            _, step_passes, num = count_zeros(np.array([step]), num, self.dial_size)
+            passes += step_passes
+            print(f'after -- number is {num}, zero_count={passes}')
+            print('==================')
+
+def iter_step_chunks(filename, chunk_lines=STREAM_CHUNK_LINES):
+    """Yield the signed steps of a file chunk by chunk without reading it all.
+
+    Args:
+        filename (str): The puzzle input, demo.txt is used in demo mode.
+        chunk_lines (int): Number of lines parsed at a time.
+
+    Yields:
+        1d int64 numpy arrays of signed steps.
+    """
+    with open(resolve_input_path(filename), 'rb') as file:
+        while True:
+            chunk = b''.join(itertools.islice(file, chunk_lines))
+            if not chunk:
+                break
+            yield parse_steps(chunk)
+
+def count_zeros_streaming(filename, start_num, dial_size=DIAL_SIZE, chunk_lines=STREAM_CHUNK_LINES, verbose=False):
+    """Count landings on and passes through zero for a file of any size.
+
+    Returns:
+        The Dial after all steps, with its landings and passes counters.
+    """
+    dial = Dial(start_num, dial_size, verbose)
+    for steps in iter_step_chunks(filename, chunk_lines):
+        dial.turn(steps)
+
+    return dial
@@ -1,70 +1,24 @@
 import os
+import sys
 
-demo_mode = int(os.getenv('demo'))
-
-def get_lines(filename):
-    demo_filename = 'demo.txt'
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        else:
-            with open(demo_filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        
-        return lines
-    except Exception as e:
-        print(f'File read operation exception happened. See details: {e}')
-        return []
-    
-def get_content(filename):
-    demo_filename = 'demo.txt'
-
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                content = file.read()
-        else:
-            with open(demo_filename, 'r') as file:
-                content = file.read()        
-        return content
-    except Exception as e:
-        print(f'file reading error. See details {e}')
-
-def get_steps(lines):
-    """Get the steps for unlocking the safe.
-    
-    Args:
-        lines (list): Input lines from the text file.
-
-    Returns:
-        A list of steps each of which is a tuple, e.g., ('L', 30).
-    """
-    steps = []
-    for line in lines:
-        direction = line[0]
-        counts = int(line[1:])
-        steps.append((direction, counts))
-    
-    return steps
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.input_loader import get_env_int, open_input
+from day1_dial import count_zeros, count_zeros_streaming, get_steps_from_buffer
 
 def get_num_zeros(steps, start_num):
     """Calculate the number of times reaching zero."""
-
-    zero_count = 0
-    curr_num = start_num
-    for direction, step in steps:
-        if direction == 'L':
-            curr_num = (curr_num - step) % 100     
-        else:
-            curr_num = (curr_num + step) % 100
-        
-        if curr_num == 0:
-            zero_count += 1
-    
-    return zero_count
-
-lines = get_lines('day1.txt')
-steps = get_steps(lines)
-num_zeros = get_num_zeros(steps, 50)
-print(num_zeros)
\ No newline at end of file
+    landings, passes, end_num = count_zeros(steps, start_num)
+    return landings
+
+def main():
+    # stream=1 reads the rotations chunk by chunk for inputs too big for memory
+    if get_env_int('stream'):
+        num_zeros = count_zeros_streaming('day1.txt', 50).landings
+    else:
+        with open_input('day1.txt') as buffer:
+            steps = get_steps_from_buffer(buffer)
+        num_zeros = get_num_zeros(steps, 50)
+    print(num_zeros)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""Arithmetic enumeration of invalid (repeated-digit) IDs for day02.
+
+An L-digit ID made of a b-digit block repeated L / b times is
+
+    seed * (10^(L-b) + ... + 10^b + 1) = seed * (10^L - 1) / (10^b - 1)
+
+for a b-digit seed, so the invalid IDs of one (L, b) pair inside a range are a
+run of consecutive seeds and their sum is an arithmetic series. IDs like 111111
+repeat several blocks (1, 11 and 111); they are counted once by splitting every
+block length into IDs whose shortest repeating block is exactly that length.
+The cost depends on the number of digit lengths, not on the width of a range.
+"""
+import heapq
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.pool import run_tasks
+
+# Widest piece of a range evaluated as one task in parallel mode
+DEFAULT_CHUNK_SIZE = 10 ** 12
+
+def get_divisors(num):
+    """Get all divisors of a positive number in increasing order."""
+    small, large = [], []
+    i = 1
+    while i * i <= num:
+        if num % i == 0:
+            small.append(i)
+            if i * i != num:
+                large.append(num // i)
+        i += 1
+
+    return small + large[::-1]
+
+def repeat_multiplier(num_digits, block_len):
+    """The number that turns a block_len-digit seed into a num_digits-digit repetition of it."""
+    return (10 ** num_digits - 1) // (10 ** block_len - 1)
+
+def get_seed_range(start, end, num_digits, block_len):
+    """Get the first and last seeds whose repetition lies within [start, end]."""
+    multiplier = repeat_multiplier(num_digits, block_len)
+    first_seed = max(10 ** (block_len - 1), -(-start // multiplier))
+    last_seed = min(10 ** block_len - 1, end // multiplier)
+
+    return first_seed, last_seed
+
+def sum_repeats(start, end, num_digits, block_len):
+    """Sum every num_digits-digit ID in [start, end] made of one block_len-digit block repeated."""
+    first_seed, last_seed = get_seed_range(start, end, num_digits, block_len)
+    if first_seed > last_seed:
+        return 0
+
+    seed_sum = (first_seed + last_seed) * (last_seed - first_seed + 1) // 2
+    return repeat_multiplier(num_digits, block_len) * seed_sum
+
+def get_repeating_periods(num_digits, repeat_counts=None):
+    """Get the shortest-block lengths that make a num_digits-digit ID invalid.
+
+    Args:
+        num_digits (int): Number of digits in the ID.
+        repeat_counts (iterable): Allowed numbers of repeats, e.g. (2,) for
+            'repeated exactly twice'. None allows any number of repeats >= 2.
+
+    Returns:
+        A sorted list of block lengths. An ID is invalid if its shortest
+        repeating block has one of these lengths.
+    """
+    block_lens = [
+        block_len for block_len in get_divisors(num_digits)
+        if block_len < num_digits and (repeat_counts is None or num_digits // block_len in repeat_counts)
+    ]
+
+    # A block that repeats itself also repeats its own shorter blocks
+    periods = set()
+    for block_len in block_lens:
+        periods.update(get_divisors(block_len))
+
+    return sorted(periods)
+
+def iter_digit_lengths(start, end):
+    """Yield (num_digits, low, high) pieces of [start, end] with a fixed number of digits."""
+    for num_digits in range(len(str(max(start, 1))), len(str(end)) + 1):
+        low = max(start, 10 ** (num_digits - 1))
+        high = min(end, 10 ** num_digits - 1)
+        if low <= high:
+            yield num_digits, low, high
+
+def sum_invalid_ids(start, end, repeat_counts=None):
+    """Sum all invalid IDs in [start, end] without visiting the valid ones.
+
+    Args:
+        start (int): First ID of the range.
+        end (int): Last ID of the range, inclusive.
+        repeat_counts (iterable): Allowed numbers of repeats, see get_repeating_periods.
+
+    Returns:
+        The sum of the invalid IDs.
+    """
+    total = 0
+    for num_digits, low, high in iter_digit_lengths(start, end):
+        periods = get_repeating_periods(num_digits, repeat_counts)
+
+        # exact[p]: sum of IDs whose shortest repeating block has length p
+        exact = {}
+        for period in periods:
+            shorter = sum(exact[p] for p in periods if p < period and period % p == 0)
+            exact[period] = sum_repeats(low, high, num_digits, period) - shorter
+        total += sum(exact.values())
+
+    return total
+
+def is_primitive_seed(seed, block_len):
+    """Check if a block_len-digit seed is not itself a repetition of a shorter block."""
+    for period in get_divisors(block_len)[:-1]:
+        if seed % repeat_multiplier(block_len, period) == 0:
+            return False
+    return True
+
+def iter_exact_repeats(low, high, num_digits, period):
+    """Yield the IDs in [low, high] whose shortest repeating block has length period."""
+    first_seed, last_seed = get_seed_range(low, high, num_digits, period)
+    multiplier = repeat_multiplier(num_digits, period)
+    for seed in range(first_seed, last_seed + 1):
+        if is_primitive_seed(seed, period):
+            yield seed * multiplier
+
+def iter_invalid_ids(start, end, repeat_counts=None):
+    """Yield every invalid ID in [start, end] in increasing order, each once.
+
+    Args:
+        start (int): First ID of the range.
+        end (int): Last ID of the range, inclusive.
+        repeat_counts (iterable): Allowed numbers of repeats, see get_repeating_periods.
+    """
+    for num_digits, low, high in iter_digit_lengths(start, end):
+        runs = [
+            iter_exact_repeats(low, high, num_digits, period)
+            for period in get_repeating_periods(num_digits, repeat_counts)
+        ]
+        yield from heapq.merge(*runs)
+
+def merge_ranges(ranges):
+    """Merge overlapping or adjacent (start, end) ranges.
+
+    Args:
+        ranges (list): A list of (start, end) tuples, not modified.
+
+    Returns:
+        A sorted list of disjoint (start, end) tuples.
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+def split_range(start, end, chunk_size):
+    """Split [start, end] into pieces of at most chunk_size IDs."""
+    return [(low, min(low + chunk_size - 1, end)) for low in range(start, end + 1, chunk_size)]
+
+def total_invalid_id_sum(ranges, repeat_counts=None, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Sum the invalid IDs of all ranges, optionally across a process pool.
+
+    The ranges are merged first, so an ID listed by overlapping ranges is
+    counted once and nothing is computed twice. Wide ranges are split into
+    chunks so the pool stays busy.
+
+    Args:
+        ranges (list): A list of (start, end) tuples.
+        repeat_counts (iterable): Allowed numbers of repeats, see get_repeating_periods.
+        workers (int): Number of worker processes, 1 runs everything in this process.
+        chunk_size (int): Widest piece of a range evaluated as one task.
+
+    Returns:
+        The sum of the invalid IDs.
+    """
+    tasks = [
+        (low, high, repeat_counts)
+        for start, end in merge_ranges(ranges)
+        for low, high in split_range(start, end, chunk_size)
+    ]
+    return sum(run_tasks(sum_invalid_ids, tasks, workers))
@@ -1,35 +1,12 @@
 import os
+import sys
 
-demo_mode = int(os.getenv('demo'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.input_loader import get_content, get_env_int
+from day2_invalid_ids import sum_invalid_ids, total_invalid_id_sum
 
-def get_lines(filename):
-    demo_filename = 'demo.txt'
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        else:
-            with open(demo_filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        
-        return lines
-    except Exception as e:
-        print(f'File read operation exception happened. See details: {e}')
-        return []
-    
-def get_content(filename):
-    demo_filename = 'demo.txt'
-
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                content = file.read()
-        else:
-            with open(demo_filename, 'r') as file:
-                content = file.read()        
-        return content
-    except Exception as e:
-        print(f'file reading error. See details {e}')
+# Number of times a block must repeat for an ID to be invalid, None for any >= 2
+REPEAT_COUNTS = (2,)
 
 def get_data_ranges(line):
     """Get data range from input and return a list of tuples of (start, end)."""
@@ -43,23 +20,21 @@ def get_data_ranges(line):
     return int_ranges
 
 def get_invalid_id_sum(data_range):
-    """Get invalid id count from a range like (11, 22)."""
-    invalid_id_sum = 0
+    """Get the sum of invalid ids in a range like (11, 22).
+
+    An ID is invalid if it is some sequence of digits repeated exactly twice, like 6464.
+    """
     start, end = data_range
-    for num in range(start, end + 1):
-        num_str = str(num)
-        mid = len(num_str) // 2
-        left, right = num_str[:mid], num_str[mid:]
-        if left == right:
-            invalid_id_sum += num
+    return sum_invalid_ids(start, end, repeat_counts=REPEAT_COUNTS)
 
-    return invalid_id_sum
+def main():
+    line = get_content('day2.txt')
+    data_ranges = get_data_ranges(line)
 
-line = get_content('day2.txt')
-data_ranges = get_data_ranges(line)
-total_invalid_id_sum = 0
-for data_range in data_ranges:
-    total_invalid_id_sum += get_invalid_id_sum(data_range)
-print(f'total_invalid_id_sum = {total_invalid_id_sum}')
+    # Overlapping ranges are merged, workers=N spreads the ranges over N processes
+    workers = get_env_int('workers', 1)
+    invalid_id_sum = total_invalid_id_sum(data_ranges, REPEAT_COUNTS, workers)
+    print(f'total_invalid_id_sum = {invalid_id_sum}')
 
-    
\ No newline at end of file
+if __name__ == '__main__':
+    main()
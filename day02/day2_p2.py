@@ -1,35 +1,12 @@
 import os
+import sys
 
-demo_mode = int(os.getenv('demo'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.input_loader import get_content, get_env_int
+from day2_invalid_ids import sum_invalid_ids, total_invalid_id_sum
 
-def get_lines(filename):
-    demo_filename = 'demo.txt'
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        else:
-            with open(demo_filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        
-        return lines
-    except Exception as e:
-        print(f'File read operation exception happened. See details: {e}')
-        return []
-    
-def get_content(filename):
-    demo_filename = 'demo.txt'
-
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                content = file.read()
-        else:
-            with open(demo_filename, 'r') as file:
-                content = file.read()        
-        return content
-    except Exception as e:
-        print(f'file reading error. See details {e}')
+# Number of times a block must repeat for an ID to be invalid, None for any >= 2
+REPEAT_COUNTS = None
 
 def get_data_ranges(line):
     """Get data range from input and return a list of tuples of (start, end)."""
@@ -42,22 +19,6 @@ def get_data_ranges(line):
     
     return int_ranges
 
-def split_str_into_parts(input_str, num_parts):
-    """Split a string evenly into number of parts specified."""
-    input_len = len(input_str)
-    if input_len % num_parts != 0:
-        return []
-    
-    parts = []
-    part_length = input_len // num_parts
-    for i in range(num_parts):
-        start_idx = i * part_length
-        end_idx = (i + 1) * part_length 
-        parts.append(input_str[start_idx: end_idx])
-
-    return parts
-
-
 def get_invalid_id_sum(data_range):
     """Get invalid id count from a range like (11, 22).
     
@@ -65,26 +26,17 @@ def get_invalid_id_sum(data_range):
     So, 12341234 (1234 two times), 123123123 (123 three times), 1212121212 (12 five times), 
     and 1111111 (1 seven times) are all invalid IDs.
     """
-    invalid_id_sum = 0
     start, end = data_range
-    for num in range(start, end + 1):
-        num_str = str(num)
-        num_str_len = len(num_str)
-        for num_parts in range(2, num_str_len + 1):
-            parts = split_str_into_parts(num_str, num_parts)
-            parts_set = set(parts)
-            if len(parts_set) == 1:
-                invalid_id_sum += num
-                break
-
-    return invalid_id_sum
+    return sum_invalid_ids(start, end, repeat_counts=REPEAT_COUNTS)
 
-line = get_content('day2.txt')
-data_ranges = get_data_ranges(line)
-total_invalid_id_sum = 0
-for data_range in data_ranges:
-    total_invalid_id_sum += get_invalid_id_sum(data_range)
-print(f'total_invalid_id_sum = {total_invalid_id_sum}')
+def main():
+    line = get_content('day2.txt')
+    data_ranges = get_data_ranges(line)
 
+    # Overlapping ranges are merged, workers=N spreads the ranges over N processes
+    workers = get_env_int('workers', 1)
+    invalid_id_sum = total_invalid_id_sum(data_ranges, REPEAT_COUNTS, workers)
+    print(f'total_invalid_id_sum = {invalid_id_sum}')
 
-    
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Largest k-digit joltage of a battery bank, shared by both day03 parts.
+
+The largest k-digit subsequence is found greedily with a monotonic stack: a
+digit pops every smaller digit before it while there are still digits left to
+drop. Every digit is pushed and popped at most once, so a bank of n digits
+takes O(n) whatever k is.
+
+For many banks of the same length, largest_subsequences_batch picks digit after
+digit for all banks at once with a per-row argmax over a shrinking window.
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.input_loader import MAX_INT64_DIGITS
+
+# Digit strings longer than this are converted piecewise, int() refuses
+# more than 4300 digits by default
+INT_CONVERSION_DIGITS = 4000
+
+def largest_subsequence(battery_bank, num_digits):
+    """Pick the num_digits digits of the bank that form the largest number, in order.
+
+    Args:
+        battery_bank (str or bytes): The digits of the bank, e.g. '987654321111111'.
+        num_digits (int): How many batteries to turn on.
+
+    Returns:
+        The chosen digits as ASCII bytes, e.g. b'98'.
+    """
+    if isinstance(battery_bank, str):
+        battery_bank = battery_bank.encode()
+    if not 0 < num_digits <= len(battery_bank):
+        raise ValueError(f'Cannot pick {num_digits} digits from a bank of {len(battery_bank)}')
+
+    digits_to_drop = len(battery_bank) - num_digits
+    stack = bytearray()
+    for digit in battery_bank:
+        while digits_to_drop and stack and stack[-1] < digit:
+            stack.pop()
+            digits_to_drop -= 1
+        stack.append(digit)
+
+    return bytes(stack[:num_digits])
+
+def digits_to_int(digits):
+    """Convert ASCII digits to an int, splitting long ones to stay under int()'s digit limit."""
+    if len(digits) <= INT_CONVERSION_DIGITS:
+        return int(digits)
+
+    mid = len(digits) // 2
+    return digits_to_int(digits[:mid]) * 10 ** (len(digits) - mid) + digits_to_int(digits[mid:])
+
+def get_largest_num(battery_bank, num_digits):
+    """Get the largest number with num_digits digits from the battery bank."""
+    return digits_to_int(largest_subsequence(battery_bank, num_digits))
+
+def load_battery_banks(buffer):
+    """Load equal-length banks from an InputBuffer into a 2d array of digit values.
+
+    Returns:
+        A uint8 numpy array with one row per bank.
+
+    Raises:
+        ValueError: If the banks differ in length or hold non-digit characters.
+    """
+    grid = buffer.grid()
+    if ((grid < ord('0')) | (grid > ord('9'))).any():
+        raise ValueError('Battery banks must be equal-length lines of digits')
+
+    return grid - np.uint8(ord('0'))
+
+def largest_subsequences_batch(banks, num_digits):
+    """Get the largest num_digits-digit number of every bank in one vectorized pass.
+
+    Digit i of every bank is the first maximum in the window that starts right
+    after the previous pick and leaves room for the digits still to come.
+
+    Args:
+        banks (ndarray): A 2d array of digit values, one bank per row.
+        num_digits (int): How many batteries to turn on in each bank.
+
+    Returns:
+        A tuple (values, total): the number of each bank (int64, or Python ints
+        when num_digits is above 18) and their sum as an int.
+    """
+    num_banks, bank_len = banks.shape
+    if not 0 < num_digits <= bank_len:
+        raise ValueError(f'Cannot pick {num_digits} digits from banks of {bank_len}')
+
+    dtype = np.int64 if num_digits <= MAX_INT64_DIGITS else object
+    values = np.zeros(num_banks, dtype=dtype)
+    rows = np.arange(num_banks)
+    left = np.zeros(num_banks, dtype=np.int64)  # First column each bank may still pick
+    for i in range(num_digits):
+        right = bank_len - num_digits + i  # Last column that leaves room for the rest
+        window_start = int(left.min())
+        window = banks[:, window_start:right + 1].astype(np.int8)
+        cols = np.arange(window_start, right + 1)
+        window[cols < left[:, None]] = -1
+        picks = window.argmax(axis=1) + window_start
+
+        values = values * 10 + banks[rows, picks].astype(dtype)
+        left = picks + 1
+
+    return values, sum(values.tolist())
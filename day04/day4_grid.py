@@ -0,0 +1,161 @@
+"""Paper roll grid engine for day04.
+
+The map is a boolean NumPy array (True for '@'). The 8-neighbor roll count of
+every cell comes from adding up the 8 shifted views of a zero-padded copy, so
+the whole grid is handled in a few vectorized passes instead of a Python loop
+per cell.
+
+Removing rolls (part 2) keeps those counts live: a removed roll decrements only
+its 8 neighbors, and a neighbor joins the next round once its count drops below
+the threshold. Every roll is removed at most once, so the peeling is O(cells).
+
+count_accessible_bits does part 1 on a bit-packed BitGrid instead: the 8
+neighbor rows of a row are added with a bit-sliced counter (one int per bit of
+the count), so a whole row is counted with a few dozen big-int operations.
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.bitgrid import BitGrid
+
+ROLL = ord('@')
+
+# A roll is accessible by forklifts if fewer than this many rolls surround it
+ACCESS_THRESHOLD = 4
+
+NEIGHBOR_OFFSETS = [
+    (-1, 0),  # N
+    (0, 1),  # E
+    (1, 0),  # S
+    (0, -1),  # W
+    (-1, 1),  # NE
+    (1, 1),  # SE
+    (1, -1),  # SW
+    (-1, -1),  # NW
+]
+
+def load_roll_grid(buffer):
+    """Load the map from an InputBuffer as a 2d bool array, True where there is a roll."""
+    return buffer.grid() == ROLL
+
+def neighbor_counts(rolls):
+    """Count the rolls among the 8 neighbors of every cell.
+
+    Args:
+        rolls (ndarray): A 2d bool array of roll locations.
+
+    Returns:
+        A uint8 array of the same shape.
+    """
+    num_rows, num_cols = rolls.shape
+    padded = np.pad(rolls, 1).view(np.uint8)
+    counts = np.zeros(rolls.shape, dtype=np.uint8)
+    for d_row, d_col in NEIGHBOR_OFFSETS:
+        counts += padded[1 + d_row:1 + d_row + num_rows, 1 + d_col:1 + d_col + num_cols]
+
+    return counts
+
+def accessible_rolls(rolls, threshold=ACCESS_THRESHOLD):
+    """Get a mask of the rolls with fewer than threshold neighboring rolls."""
+    return rolls & (neighbor_counts(rolls) < threshold)
+
+def peel_rolls(rolls, threshold=ACCESS_THRESHOLD, track_rounds=False):
+    """Keep removing accessible rolls until none is left to remove.
+
+    Each round removes every roll accessible at the start of that round, the
+    same rounds a full rescan of the grid would find.
+
+    Args:
+        rolls (ndarray): A 2d bool array of roll locations, not modified.
+        threshold (int): A roll is accessible with fewer neighboring rolls than this.
+        track_rounds (bool): Also report how many rolls each round removed.
+
+    Returns:
+        A tuple (num_removed, round_counts), round_counts is None unless track_rounds.
+    """
+    num_rows, num_cols = rolls.shape
+
+    # Work on flat indices into a zero-padded grid, so neighbors never go out of bounds
+    padded_cols = num_cols + 2
+    alive = np.pad(rolls, 1).ravel()
+    counts = np.pad(neighbor_counts(rolls), 1).ravel().astype(np.int16)
+    offsets = np.array([d_row * padded_cols + d_col for d_row, d_col in NEIGHBOR_OFFSETS])
+
+    frontier = np.flatnonzero(alive & (counts < threshold))
+
+    num_removed = 0
+    round_counts = [] if track_rounds else None
+    while frontier.size:
+        alive[frontier] = False
+        num_removed += frontier.size
+        if track_rounds:
+            round_counts.append(int(frontier.size))
+
+        # One sort gives both the distinct neighbors and how many removed rolls touch each
+        neighbors, hits = np.unique((frontier[:, None] + offsets).ravel(), return_counts=True)
+        counts[neighbors] -= hits.astype(counts.dtype)
+        # A roll still alive was never in a frontier, so it cannot be queued twice
+        frontier = neighbors[alive[neighbors] & (counts[neighbors] < threshold)]
+
+    return num_removed, round_counts
+
+def add_bit_slices(counter, bits):
+    """Add one to the bit-sliced counter in every column where bits is set.
+
+    Args:
+        counter (list): Bit i of every column's count, lowest bit first. Updated in place.
+        bits (int): The columns to increment.
+    """
+    for i in range(len(counter)):
+        carry = counter[i] & bits
+        counter[i] ^= bits
+        bits = carry
+        if not bits:
+            return
+    counter.append(bits)
+
+def bit_slices_below(counter, threshold, mask):
+    """Get the columns whose bit-sliced count is below threshold."""
+    if threshold.bit_length() > len(counter):
+        return mask
+
+    # Compare from the top bit down: below once a clear bit meets a set threshold bit
+    below, equal = 0, mask
+    for i in reversed(range(threshold.bit_length())):
+        bits = counter[i] if i < len(counter) else 0
+        if (threshold >> i) & 1:
+            below |= equal & ~bits
+            equal &= bits
+        else:
+            equal &= ~bits
+    for bits in counter[threshold.bit_length():]:
+        below &= ~bits
+
+    return below & mask
+
+def count_accessible_bits(rolls, threshold=ACCESS_THRESHOLD):
+    """Count the rolls with fewer than threshold neighboring rolls on a BitGrid.
+
+    Args:
+        rolls (BitGrid): The roll locations.
+        threshold (int): A roll is accessible with fewer neighboring rolls than this.
+
+    Returns:
+        The number of accessible rolls.
+    """
+    total = 0
+    for row in range(rolls.num_rows):
+        counter = []
+        for d_row, d_col in NEIGHBOR_OFFSETS:
+            # Moving the row by -d_col lines up the neighbor at col + d_col with col
+            add_bit_slices(counter, rolls.shift(rolls.row(row + d_row), -d_col))
+        total += (rolls.rows[row] & bit_slices_below(counter, threshold, rolls.mask)).bit_count()
+
+    return total
+
+def load_roll_bits(filename):
+    """Load the map straight from the puzzle input as a BitGrid of rolls."""
+    return BitGrid.from_file(filename, chr(ROLL))
@@ -0,0 +1,211 @@
+"""Fresh ID ranges for day05.
+
+The ranges are merged once into disjoint intervals and stored as two flat
+sorted arrays of starts and ends. An ID is fresh if the last interval starting
+at or before it also ends at or after it, so a lookup is one binary search:
+bisect for a single ID, np.searchsorted for a whole array of IDs at once.
+
+IntervalSet is the dynamic counterpart: ranges are added and removed one at a
+time, neighbors are coalesced on the spot and the number of covered IDs is
+kept up to date, so nothing is re-sorted or re-merged. Its ranges live in
+plain lists, so an update is a binary search plus an O(n) list splice.
+
+The input is streamed: the ranges are read line by line up to the blank line,
+then the IDs are parsed and checked in fixed-size chunks. Counting distinct IDs
+keeps the fresh IDs of every chunk, with distinct=False only the ranges stay
+in memory.
+"""
+import bisect
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.input_loader import STREAM_CHUNK_BYTES, iter_int_chunks, resolve_input_path
+
+def merge_intervals(fresh_id_ranges):
+    """Merge fresh id ranges.
+
+    Args:
+        fresh_id_ranges (list): A list of [start, end] ranges, not modified.
+
+    Returns:
+        A new sorted list of disjoint [start, end] ranges.
+    """
+    merged = []
+    for start, end in sorted(fresh_id_ranges, key=lambda x: x[0]):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    return merged
+
+def read_fresh_ranges(file):
+    """Read the 'start-end' lines of a binary file up to the first blank line.
+
+    The file is left right after the blank line, at the first ID.
+
+    Returns:
+        A list of [start, end] ranges.
+    """
+    fresh_id_ranges = []
+    for line in file:
+        line = line.strip()
+        if not line:
+            break
+        start, end = line.split(b'-')
+        fresh_id_ranges.append([int(start), int(end)])
+
+    return fresh_id_ranges
+
+def load_fresh_ranges(filename):
+    """Read only the fresh ID ranges of the puzzle input, the IDs are never read."""
+    with open(resolve_input_path(filename), 'rb') as file:
+        return read_fresh_ranges(file)
+
+class IntervalIndex:
+    """A static set of fresh IDs answering membership by binary search."""
+
+    def __init__(self, fresh_id_ranges):
+        """Build the index.
+
+        Args:
+            fresh_id_ranges (list): A list of [start, end] ranges (ints or digit
+                strings), both ends inclusive. Not modified.
+        """
+        merged = merge_intervals([[int(start), int(end)] for start, end in fresh_id_ranges])
+        self.starts = np.array([start for start, _ in merged], dtype=np.int64)
+        self.ends = np.array([end for _, end in merged], dtype=np.int64)
+        self._start_list = self.starts.tolist()
+        self._end_list = self.ends.tolist()
+
+    def __len__(self):
+        return len(self._start_list)
+
+    def __contains__(self, id_int):
+        i = bisect.bisect_right(self._start_list, id_int) - 1
+        return i >= 0 and id_int <= self._end_list[i]
+
+    def contains_many(self, ids):
+        """Check a whole array of IDs at once.
+
+        Args:
+            ids (array_like): The IDs to check.
+
+        Returns:
+            A bool numpy array, True where the ID is fresh.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(self):
+            return np.zeros(ids.shape, dtype=bool)
+
+        i = np.searchsorted(self.starts, ids, side='right') - 1
+        return (i >= 0) & (ids <= self.ends[np.maximum(i, 0)])
+
+
+class IntervalSet:
+    """A changing set of fresh IDs, kept as disjoint, non-adjacent sorted ranges.
+
+    Ranges are found by binary search over two parallel lists of starts and
+    ends, so membership and overlap queries are O(log n). Adding or removing a
+    range computes only the ranges it overlaps, but replacing them is a list
+    slice assignment that shifts every later range: O(n) element moves per
+    update (a single memmove, cheap next to rebuilding the set).
+    """
+
+    def __init__(self, fresh_id_ranges=()):
+        self.starts = []
+        self.ends = []
+        self.covered = 0
+        for start, end in fresh_id_ranges:
+            self.add(int(start), int(end))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def __contains__(self, id_int):
+        i = bisect.bisect_right(self.starts, id_int) - 1
+        return i >= 0 and id_int <= self.ends[i]
+
+    def add(self, start, end):
+        """Add the IDs start to end (inclusive), merging with overlapping or adjacent ranges."""
+        if start > end:
+            return
+
+        # Ranges i to j - 1 overlap or touch [start, end]
+        i = bisect.bisect_left(self.ends, start - 1)
+        j = bisect.bisect_right(self.starts, end + 1)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+            self.covered -= sum(self.ends[k] - self.starts[k] + 1 for k in range(i, j))
+
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+        self.covered += end - start + 1
+
+    def remove(self, start, end):
+        """Remove the IDs start to end (inclusive), splitting a range that sticks out on both sides."""
+        if start > end:
+            return
+
+        # Ranges i to j - 1 overlap [start, end]
+        i = bisect.bisect_left(self.ends, start)
+        j = bisect.bisect_right(self.starts, end)
+        if i >= j:
+            return
+
+        new_starts, new_ends = [], []
+        if self.starts[i] < start:
+            new_starts.append(self.starts[i])
+            new_ends.append(start - 1)
+        if self.ends[j - 1] > end:
+            new_starts.append(end + 1)
+            new_ends.append(self.ends[j - 1])
+
+        self.covered -= sum(self.ends[k] - self.starts[k] + 1 for k in range(i, j))
+        self.covered += sum(e - s + 1 for s, e in zip(new_starts, new_ends))
+        self.starts[i:j] = new_starts
+        self.ends[i:j] = new_ends
+
+    def overlaps(self, start, end):
+        """Check if any ID from start to end (inclusive) is in the set."""
+        i = bisect.bisect_left(self.ends, start)
+        return i < len(self.starts) and self.starts[i] <= end
+
+    def count_fresh_ids(self):
+        """Get the number of IDs in the set, kept up to date by add and remove."""
+        return self.covered
+
+def count_fresh_ids_streaming(filename, distinct=True, chunk_bytes=STREAM_CHUNK_BYTES):
+    """Count the fresh IDs of the puzzle input, checking the IDs chunk by chunk as they are read.
+
+    Args:
+        filename (str): The puzzle input, demo.txt is used in demo mode.
+        distinct (bool): Count an ID listed several times once. This keeps the
+            fresh IDs of every chunk in memory, without it only the ranges are kept.
+        chunk_bytes (int): Number of bytes of IDs read at a time.
+
+    Returns:
+        The number of fresh IDs.
+    """
+    with open(resolve_input_path(filename), 'rb') as file:
+        index = IntervalIndex(read_fresh_ranges(file))
+        fresh_count = 0
+        fresh_chunks = []
+        for ids in iter_int_chunks(file, chunk_bytes):
+            fresh = ids[index.contains_many(ids)]
+            if distinct:
+                fresh_chunks.append(np.unique(fresh))
+            else:
+                fresh_count += fresh.size
+
+    if distinct:
+        # One sort at the end instead of a union per chunk
+        return np.unique(np.concatenate(fresh_chunks)).size if fresh_chunks else 0
+    return fresh_count
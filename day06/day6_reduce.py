@@ -0,0 +1,77 @@
+"""Reduction of the day06 problems to their results.
+
+A '+' problem is a plain sum. A '*' problem of a tall worksheet multiplies
+numbers into thousands of digits, and a left to right product makes every step
+pay for the whole running product. Multiplying neighbors pairwise in a
+balanced tree keeps both operands about the same size, so Python's
+Karatsuba multiplication does the heavy lifting.
+
+With a modulus, every step is reduced right away and no large integer is
+built. Problems are independent, so they can also be spread over a pool.
+"""
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.pool import run_tasks
+
+def product_tree(numbers):
+    """Multiply numbers pairwise in a balanced binary tree, 1 for no numbers."""
+    numbers = list(numbers)
+    if not numbers:
+        return 1
+
+    while len(numbers) > 1:
+        products = [numbers[i] * numbers[i + 1] for i in range(0, len(numbers) - 1, 2)]
+        if len(numbers) % 2:
+            products.append(numbers[-1])
+        numbers = products
+
+    return numbers[0]
+
+def product_mod(numbers, modulus):
+    """Multiply numbers modulo modulus, reducing after every step."""
+    product = 1 % modulus
+    for number in numbers:
+        product = product * number % modulus
+
+    return product
+
+def solve_problem(numbers, op, modulus=None):
+    """Get the result of one problem.
+
+    Args:
+        numbers (list): The numbers of the problem.
+        op (str): '+' or '*'.
+        modulus (int): Return the result mod this number. None for the exact result.
+
+    Returns:
+        The result as an int.
+    """
+    if op == '+':
+        result = sum(numbers)
+        return result if modulus is None else result % modulus
+    if op == '*':
+        return product_tree(numbers) if modulus is None else product_mod(numbers, modulus)
+
+    raise ValueError(f'Unknown operator {op!r}')
+
+def solve_problems(problems, ops, modulus=None, workers=1):
+    """Get the result of every problem, optionally across a process pool.
+
+    Args:
+        problems (list): The numbers of each problem.
+        ops (iterable): The operator of each problem.
+        modulus (int): Reduce every result mod this number. None for exact results.
+        workers (int): Number of worker processes, 1 runs everything in this process.
+
+    Returns:
+        A list with the result of each problem.
+    """
+    tasks = [(numbers, op, modulus) for numbers, op in zip(problems, ops)]
+    return run_tasks(solve_problem, tasks, workers)
+
+def grand_total(results, modulus=None):
+    """Add up the problem results, mod modulus when given."""
+    total = sum(results)
+    return total if modulus is None else total % modulus
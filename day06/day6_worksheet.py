@@ -0,0 +1,85 @@
+"""Math worksheet reader for day06.
+
+The worksheet is read as a 2d uint8 array: the digit rows on top and the
+operator row at the bottom. Problems are separated by columns of spaces, found
+with one all-spaces test over the array. Numbers are built arithmetically
+(value * 10 + digit) over whole rows or columns at a time, spaces are skipped,
+so no string is ever built per number.
+
+Part 1 reads each problem's numbers left to right along the rows, part 2 reads
+them top to bottom along the columns.
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.input_loader import MAX_INT64_DIGITS
+
+SPACE = ord(' ')
+ZERO = ord('0')
+OPS = b'+*'
+
+def load_worksheet(buffer):
+    """Load the worksheet from an InputBuffer.
+
+    Returns:
+        A tuple (digits, ops): a 2d uint8 array of the digit rows (digits and
+        spaces) and the operators of the problems from left to right, e.g. '*+*+'.
+    """
+    grid = buffer.grid()
+    if grid.shape[0] < 2:
+        raise ValueError('A worksheet needs digit rows and an operator row')
+
+    digits, op_row = grid[:-1], grid[-1]
+    ops = op_row[op_row != SPACE].tobytes().decode()
+    if ops.strip(OPS.decode()):
+        raise ValueError(f'Unknown operators in {ops!r}')
+
+    return digits, ops
+
+def get_problem_bounds(digits):
+    """Find the column span of every problem.
+
+    Returns:
+        A tuple (starts, ends) of int arrays, ends exclusive.
+    """
+    in_problem = ~(digits == SPACE).all(axis=0)
+    edges = np.diff(in_problem.astype(np.int8), prepend=0, append=0)
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+def digits_dtype(num_digits):
+    return np.int64 if num_digits <= MAX_INT64_DIGITS else object
+
+def horizontal_numbers(digits, starts, ends):
+    """Read the numbers of every problem along the rows.
+
+    Returns:
+        A 2d array with one row per worksheet row and one column per problem.
+    """
+    widths = ends - starts
+    max_width = int(widths.max()) if widths.size else 0
+    values = np.zeros((digits.shape[0], starts.size), dtype=digits_dtype(max_width))
+    for offset in range(max_width):
+        in_problem = offset < widths
+        cols = np.minimum(starts + offset, digits.shape[1] - 1)
+        cells = digits[:, cols]
+        is_digit = in_problem & (cells != SPACE)
+        values = np.where(is_digit, values * 10 + (cells.astype(np.int64) - ZERO), values)
+
+    return values
+
+def vertical_numbers(digits, starts, ends):
+    """Read the numbers of every problem along the columns, top to bottom.
+
+    Returns:
+        A list with one array of numbers per problem, from its left column to its right.
+    """
+    columns = digits.T
+    values = np.zeros(columns.shape[0], dtype=digits_dtype(digits.shape[0]))
+    for row in range(columns.shape[1]):
+        cells = columns[:, row]
+        values = np.where(cells != SPACE, values * 10 + (cells.astype(np.int64) - ZERO), values)
+
+    return [values[start:end] for start, end in zip(starts, ends)]
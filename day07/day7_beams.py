@@ -0,0 +1,242 @@
+"""Tachyon beam engine for day07.
+
+Beams only move down, so the manifold is swept one row at a time.
+
+For part 1 the splitters of each row are one int of a BitGrid, and so are the
+beams entering a row. A row is crossed with three big-int operations: beams on
+a splitter are split to both sides, the others go straight on.
+
+BeamSweep keeps the number of timelines in every column instead. A splitter
+hands its count to the columns on both sides, and the sum of the counts after
+the last row is the number of timelines. The same pass counts the splits, in
+O(rows x cols) time and O(cols) memory. sweep_file does it while reading the
+input line by line, so memory does not grow with the height of the manifold.
+
+BeamHistory runs the sweep once and keeps the counts of every N-th row, so the
+timelines through any cell are a lookup (or a replay of fewer than N rows)
+instead of a new sweep.
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.bitgrid import BitGrid
+from common.input_loader import open_input, resolve_input_path
+
+SPLITTER = ord('^')
+START = ord('S')
+
+# Largest count that can be tripled (two neighbors spill into a column) within an int64
+MAX_SAFE_COUNT = np.iinfo(np.int64).max // 3
+
+def read_manifold(buffer):
+    """Read the splitters and the start of the beam from an InputBuffer.
+
+    Returns:
+        A tuple (splitters, start): a 2d bool array of the splitters and the (row, col) of 'S'.
+    """
+    grid = buffer.grid()
+    start_cells = np.argwhere(grid == START)
+    if start_cells.size == 0:
+        raise ValueError('No start S in the manifold')
+
+    return grid == SPLITTER, tuple(int(x) for x in start_cells[0])
+
+def load_manifold(filename):
+    """Load the splitters and the start of the beam from the puzzle input.
+
+    Returns:
+        A tuple (splitters, start): a BitGrid of the splitters and the (row, col) of 'S'.
+    """
+    with open_input(filename) as buffer:
+        splitters, start = read_manifold(buffer)
+        splitter_bits = BitGrid.from_array(splitters)
+
+    return splitter_bits, start
+
+def count_splits_bits(splitters, start):
+    """Count how many times the beam is split, sweeping one row at a time.
+
+    Args:
+        splitters (BitGrid): The splitter locations.
+        start (tuple): The (row, col) where the beam enters.
+
+    Returns:
+        The number of splitters hit by a beam.
+    """
+    start_row, start_col = start
+    beams = 1 << start_col
+    split_times = 0
+    for row in range(start_row + 1, splitters.num_rows):
+        hits = beams & splitters.rows[row]
+        if hits:
+            split_times += hits.bit_count()
+            beams = (beams & ~hits) | splitters.shift(hits, 1) | splitters.shift(hits, -1)
+
+    return split_times
+
+class BeamSweep:
+    """Timeline counts per column of the row the beams have reached.
+
+    Counts are int64 until they could overflow, then Python ints.
+    """
+
+    def __init__(self, num_cols, start):
+        start_row, start_col = start
+        self.row = start_row
+        self.counts = np.zeros(num_cols, dtype=np.int64)
+        self.counts[start_col] = 1
+        self.split_times = 0
+
+    @classmethod
+    def resume(cls, row, counts):
+        """Continue a sweep from the counts of an earlier row. The split count restarts at 0."""
+        sweep = cls(counts.size, (row, 0))
+        sweep.counts = counts
+        return sweep
+
+    def step(self, splitters):
+        """Move the beams down one row.
+
+        Args:
+            splitters (ndarray): A 1d bool array of the splitters of the next row.
+        """
+        self.row += 1
+        hits = splitters & (self.counts != 0)
+        if not hits.any():
+            return
+
+        self.split_times += int(np.count_nonzero(hits))
+        if self.counts.dtype != object and self.counts.max() > MAX_SAFE_COUNT:
+            self.counts = self.counts.astype(object)
+
+        split = np.where(hits, self.counts, 0)
+        counts = np.where(hits, 0, self.counts)
+        counts[:-1] += split[1:]
+        counts[1:] += split[:-1]
+        self.counts = counts
+
+    def timelines(self):
+        """Get the number of timelines reaching the current row."""
+        return int(sum(self.counts.tolist()))
+
+def sweep_manifold(splitters, start):
+    """Sweep the beams from the start to the last row.
+
+    Args:
+        splitters (ndarray): A 2d bool array of the splitters.
+        start (tuple): The (row, col) where the beam enters.
+
+    Returns:
+        The BeamSweep at the last row, with its split count and timelines.
+    """
+    num_rows, num_cols = splitters.shape
+    sweep = BeamSweep(num_cols, start)
+    for row in range(start[0] + 1, num_rows):
+        sweep.step(splitters[row])
+
+    return sweep
+
+class BeamHistory:
+    """The timeline counts of every row, from one sweep over the manifold.
+
+    The counts of every checkpoint_every-th row (from the start row on) are
+    kept. Other rows are replayed from the checkpoint above them, and the last
+    replayed row is cached for queries that walk down the rows.
+    Step never changes a counts array in place, so checkpoints share the
+    arrays of the sweep instead of copying them.
+    """
+
+    def __init__(self, splitters, start, checkpoint_every=1):
+        """Run the sweep.
+
+        Args:
+            splitters (ndarray): A 2d bool array of the splitters.
+            start (tuple): The (row, col) where the beam enters.
+            checkpoint_every (int): Keep the counts of every this many rows.
+        """
+        self.splitters = splitters
+        self.num_rows, self.num_cols = splitters.shape
+        self.start_row = start[0]
+        self.checkpoint_every = max(1, checkpoint_every)
+
+        sweep = BeamSweep(self.num_cols, start)
+        self.checkpoints = {self.start_row: sweep.counts}
+        for row in range(self.start_row + 1, self.num_rows):
+            sweep.step(splitters[row])
+            if (row - self.start_row) % self.checkpoint_every == 0:
+                self.checkpoints[row] = sweep.counts
+
+        self.split_times = sweep.split_times
+        self.num_timelines = sweep.timelines()
+        self._replayed = (None, None)
+
+    def counts_at(self, row):
+        """Get the timeline counts of every column of a row.
+
+        Returns:
+            A 1d array, zero where no beam passes. Do not modify it.
+        """
+        if not 0 <= row < self.num_rows:
+            raise IndexError(f'Row {row} is outside the manifold of {self.num_rows} rows')
+        if row < self.start_row:
+            return np.zeros(self.num_cols, dtype=np.int64)
+        if row in self.checkpoints:
+            return self.checkpoints[row]
+        if self._replayed[0] == row:
+            return self._replayed[1]
+
+        base = row - (row - self.start_row) % self.checkpoint_every
+        sweep = BeamSweep.resume(base, self.checkpoints[base])
+        for next_row in range(base + 1, row + 1):
+            sweep.step(self.splitters[next_row])
+        self._replayed = (row, sweep.counts)
+
+        return sweep.counts
+
+    def timelines_at(self, row, col):
+        """Get the number of timelines passing through (row, col)."""
+        return int(self.counts_at(row)[col])
+
+    def active_columns(self, row):
+        """Get the columns of a row that a beam passes through."""
+        return np.flatnonzero(self.counts_at(row))
+
+def splitter_mask(line, num_cols):
+    """Get the splitters of one input line as a bool array of num_cols columns."""
+    cells = np.frombuffer(line, dtype=np.uint8)[:num_cols]
+    mask = np.zeros(num_cols, dtype=bool)
+    mask[:cells.size] = cells == SPLITTER
+    return mask
+
+def sweep_file(filename):
+    """Sweep the beams while reading the puzzle input one line at a time.
+
+    Only the current line and the per-column counts are kept in memory. The
+    manifold is as wide as the line with the start 'S'. Blank lines are skipped.
+
+    Args:
+        filename (str): The puzzle input, demo.txt is used in demo mode.
+
+    Returns:
+        The BeamSweep at the last row, with its split count and timelines.
+    """
+    sweep = None
+    with open(resolve_input_path(filename), 'rb') as file:
+        for row, line in enumerate(file):
+            line = line.rstrip(b'\r\n')
+            if not line:
+                continue
+            if sweep is None:
+                start_col = line.find(b'S')
+                if start_col != -1:
+                    sweep = BeamSweep(len(line), (row, start_col))
+                continue
+            sweep.step(splitter_mask(line, sweep.counts.size))
+
+    if sweep is None:
+        raise ValueError('No start S in the manifold')
+
+    return sweep
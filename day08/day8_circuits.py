@@ -0,0 +1,284 @@
+"""Circuits of junction boxes for day08.
+
+Boxes are integer IDs (their line number) and circuits are the components of
+a disjoint-set forest over them: a parent list with path compression and
+union by size, so every connection costs near O(1) instead of copying the
+members of a merged circuit.
+
+Connecting shortest edges first until one circuit is left builds the minimum
+spanning tree, and the edge that joins the last two circuits is its longest
+edge. prim_mst grows that tree from one box with dense NumPy distance rows
+instead: O(n^2) time but only O(n) memory, no edge list at all.
+
+CircuitModel keeps the spanning tree and the shortest connections of a box
+list that changes a few boxes at a time. A new box only needs its own
+distance row: the new tree is a spanning tree of the old tree edges plus the
+new box's edges, and a new shortest connection must be shorter than the
+current k-th. Removing a box falls back to a rebuild.
+"""
+import heapq
+import itertools
+
+import numpy as np
+
+from day8_edges import iter_edges_by_distance, k_smallest_edges
+
+class DisjointSet:
+    """Circuits over box IDs 0..size-1, each box starting in its own circuit."""
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.sizes = [1] * size
+        self.num_components = size
+        self.last_union = None  # The last (a, b) that merged two circuits
+
+    def find(self, node):
+        """Get the root of the node's circuit, halving the path on the way."""
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, node1, node2):
+        """Connect two boxes.
+
+        Returns:
+            True if this merged two circuits, False if they were already connected.
+        """
+        root1, root2 = self.find(node1), self.find(node2)
+        if root1 == root2:
+            return False
+
+        if self.sizes[root1] < self.sizes[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.sizes[root1] += self.sizes[root2]
+        self.num_components -= 1
+        self.last_union = (node1, node2)
+
+        return True
+
+    def connected(self, node1, node2):
+        return self.find(node1) == self.find(node2)
+
+    def component_size(self, node):
+        return self.sizes[self.find(node)]
+
+    def is_connected(self):
+        """Check if every box is in one circuit."""
+        return self.num_components <= 1
+
+    def component_sizes(self):
+        """Get the size of every circuit, single boxes included."""
+        return [self.sizes[node] for node in range(len(self.parent)) if self.parent[node] == node]
+
+    def top_sizes(self, k):
+        """Get the k largest circuit sizes, largest first."""
+        return heapq.nlargest(k, self.component_sizes())
+
+def connect_shortest(boxes, num_connections, workers=1, method='grid'):
+    """Make the num_connections shortest connections, joined boxes included.
+
+    Args:
+        boxes (ndarray): An (n, 3) int64 array of box coordinates.
+        num_connections (int): How many of the shortest edges to connect.
+        workers (int): Number of worker processes for the dense kernel.
+        method (str): 'grid' walks the spatial grid bands, cheap for evenly
+            spread boxes. 'dense' scans all O(n^2) pairs with k_smallest_edges,
+            whose cost does not depend on how the boxes are spread.
+
+    Returns:
+        The DisjointSet of the circuits.
+    """
+    if method not in ('grid', 'dense'):
+        raise ValueError(f'Unknown method {method!r}, expected grid or dense')
+
+    if method == 'dense':
+        _, firsts, seconds = k_smallest_edges(boxes, num_connections, workers=workers)
+        edges = zip(firsts.tolist(), seconds.tolist())
+    else:
+        edges = ((node1, node2) for _, node1, node2 in iter_edges_by_distance(boxes))
+
+    circuits = DisjointSet(boxes.shape[0])
+    for node1, node2 in itertools.islice(edges, num_connections):
+        circuits.union(node1, node2)
+
+    return circuits
+
+def prim_mst(boxes):
+    """Build the minimum spanning tree of the boxes with dense Prim.
+
+    Every box outside the tree keeps its squared distance to the nearest tree
+    box. Each step adds the closest one and updates the others with a single
+    distance row, computed only for the boxes still outside.
+
+    Args:
+        boxes (ndarray): An (n, 3) int64 array of box coordinates.
+
+    Returns:
+        A tuple (mst_edges, joining_edge): the n - 1 tree edges as (dist2, i, j)
+        in the order they were added, and the (i, j) of the longest one, which
+        is the connection that joins everything into one circuit. joining_edge
+        is None for fewer than 2 boxes.
+    """
+    num_boxes = boxes.shape[0]
+    if num_boxes < 2:
+        return [], None
+
+    # Boxes outside the tree: their IDs and coordinates (one row per axis),
+    # nearest tree box and squared distance to it
+    outside = np.arange(1, num_boxes)
+    coords = boxes[1:].T.copy()
+    nearest = np.zeros(num_boxes - 1, dtype=np.int64)
+    best = ((coords - boxes[0][:, None]) ** 2).sum(axis=0)
+
+    mst_edges = []
+    for size in range(num_boxes - 1, 0, -1):
+        k = int(np.argmin(best[:size]))
+        node = int(outside[k])
+        mst_edges.append((int(best[k]), int(nearest[k]), node))
+
+        # Move the last box outside into the slot of the new tree box
+        last = size - 1
+        outside[k], nearest[k], best[k] = outside[last], nearest[last], best[last]
+        coords[:, k] = coords[:, last]
+        if not last:
+            break
+
+        dist2 = ((coords[:, :last] - boxes[node][:, None]) ** 2).sum(axis=0)
+        closer = dist2 < best[:last]
+        best[:last][closer] = dist2[closer]
+        nearest[:last][closer] = node
+
+    _, node1, node2 = max(mst_edges)
+    return mst_edges, (node1, node2)
+
+class CircuitModel:
+    """Circuits of a changing list of boxes.
+
+    Boxes get increasing integer IDs that stay valid when other boxes are
+    removed. The model keeps the minimum spanning tree (for the final
+    connection) and the num_connections shortest edges (for the circuit sizes),
+    both as (dist2, i, j) tuples with i < j.
+    """
+
+    def __init__(self, boxes, num_connections):
+        """Build the model from scratch.
+
+        Args:
+            boxes (array_like): An (n, 3) array of box coordinates, IDs are 0..n-1.
+            num_connections (int): How many shortest edges are connected.
+        """
+        boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 3)
+        self.num_connections = num_connections
+        self._boxes = boxes.copy()
+        self._alive = np.ones(boxes.shape[0], dtype=bool)
+        self.size = boxes.shape[0]
+        self.rebuild()
+
+    def __len__(self):
+        return int(np.count_nonzero(self._alive[:self.size]))
+
+    def box(self, box_id):
+        """Get the coordinates of a box."""
+        return self._boxes[box_id]
+
+    def box_ids(self):
+        """Get the IDs of the boxes in the model, in increasing order."""
+        return np.flatnonzero(self._alive[:self.size])
+
+    def rebuild(self):
+        """Recompute the spanning tree and the shortest edges from all boxes."""
+        ids = self.box_ids()
+        boxes = self._boxes[ids]
+        mst_edges, _ = prim_mst(boxes)
+        self.mst_edges = [(dist2, int(ids[i]), int(ids[j])) for dist2, i, j in mst_edges]
+        shortest = itertools.islice(iter_edges_by_distance(boxes), self.num_connections)
+        self.shortest_edges = [(dist2, int(ids[i]), int(ids[j])) for dist2, i, j in shortest]
+
+    def _grow(self):
+        """Double the room for boxes."""
+        capacity = max(1, 2 * self._boxes.shape[0])
+        boxes = np.zeros((capacity, 3), dtype=np.int64)
+        alive = np.zeros(capacity, dtype=bool)
+        boxes[:self.size] = self._boxes[:self.size]
+        alive[:self.size] = self._alive[:self.size]
+        self._boxes, self._alive = boxes, alive
+
+    def add_box(self, box):
+        """Add a box and splice it into the tree and the shortest edges.
+
+        Costs one distance row and one Kruskal pass over about 2n edges,
+        instead of a full O(n^2) rebuild.
+
+        Args:
+            box (array_like): The (x, y, z) of the new box.
+
+        Returns:
+            The ID of the new box.
+        """
+        ids = self.box_ids()
+        if self.size == self._boxes.shape[0]:
+            self._grow()
+        new_id = self.size
+        self._boxes[new_id] = box
+        self._alive[new_id] = True
+        self.size += 1
+
+        diff = self._boxes[ids] - self._boxes[new_id]
+        dist2 = np.einsum('ij,ij->i', diff, diff)
+        new_edges = list(zip(dist2.tolist(), ids.tolist(), [new_id] * ids.size))
+
+        # The new tree only uses old tree edges and edges of the new box
+        circuits = DisjointSet(self.size)
+        mst_edges = []
+        for edge in sorted(self.mst_edges + new_edges):
+            if circuits.union(edge[1], edge[2]):
+                mst_edges.append(edge)
+                if len(mst_edges) == ids.size:
+                    break
+        self.mst_edges = mst_edges
+
+        # Only edges shorter than the current k-th can join the shortest edges
+        if len(self.shortest_edges) >= self.num_connections and self.shortest_edges:
+            kth = self.shortest_edges[-1]
+            new_edges = [edge for edge in new_edges if edge < kth]
+        self.shortest_edges = heapq.nsmallest(self.num_connections, self.shortest_edges + new_edges)
+
+        return new_id
+
+    def remove_box(self, box_id):
+        """Remove a box. The tree has to be rebuilt, so this costs a full O(n^2) pass."""
+        if not (0 <= box_id < self.size and self._alive[box_id]):
+            raise KeyError(f'No box with ID {box_id}')
+
+        self._alive[box_id] = False
+        self.rebuild()
+
+    def circuits(self):
+        """Connect the shortest edges and get the DisjointSet of the circuits over box IDs.
+
+        Removed IDs are left as circuits of their own, see component_sizes.
+        """
+        circuits = DisjointSet(self.size)
+        for _, node1, node2 in self.shortest_edges:
+            circuits.union(node1, node2)
+
+        return circuits
+
+    def component_sizes(self):
+        """Get the size of every circuit of the boxes in the model."""
+        circuits = self.circuits()
+        return [circuits.sizes[node] for node in self.box_ids().tolist() if circuits.parent[node] == node]
+
+    def top_sizes(self, k):
+        """Get the k largest circuit sizes, largest first."""
+        return heapq.nlargest(k, self.component_sizes())
+
+    def joining_edge(self):
+        """Get the (i, j) of the connection that joins all boxes into one circuit, None for fewer than 2 boxes."""
+        if not self.mst_edges:
+            return None
+        _, node1, node2 = max(self.mst_edges)
+        return node1, node2
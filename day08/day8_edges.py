@@ -0,0 +1,243 @@
+"""Junction box edges for day08, shortest first, without all n^2 pairs.
+
+Only the order of the distances matters, so edges are compared by their
+integer squared length and math.sqrt is never needed.
+
+iter_edges_by_distance hashes the boxes into a uniform grid whose cells are
+at least as wide as a search radius R. Every pair closer than R then lies in
+the same or in adjacent cells, so the pairs of one distance band
+(R_old, R] come from the 14 forward neighbor cells of every cell. Each band is
+sorted and handed out before the next, larger band is searched, so the
+caller only pays for the neighborhood it actually walks through.
+
+k_smallest_edges is the dense alternative: it scans every pair, tile by tile,
+keeping only the k shortest with np.argpartition. Its cost does not depend on
+how the boxes are spread out, and row blocks can run on a process pool.
+"""
+import itertools
+import math
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.input_loader import open_input
+from common.pool import run_tasks
+
+# Edges the first distance band is sized for, and how much the radius grows per band
+FIRST_BAND_EDGES = 1024
+BAND_GROWTH = 1.5
+
+# Most cells along one axis, keeps the packed cell keys within an int64
+MAX_CELLS_PER_AXIS = 1 << 20
+
+# The cell itself and the 13 neighbor offsets that come after it, so every
+# pair of adjacent cells is visited once
+FORWARD_CELL_OFFSETS = [(0, 0, 0)] + [
+    offset for offset in itertools.product((-1, 0, 1), repeat=3) if offset > (0, 0, 0)
+]
+
+# Rows and columns of one tile of the dense distance kernel
+KERNEL_BLOCK_SIZE = 1024
+
+# Marks the pairs of a tile that are not edges (j <= i)
+NO_EDGE = np.iinfo(np.int64).max
+
+def load_boxes(buffer):
+    """Load the 'x,y,z' lines of an InputBuffer as an (n, 3) int64 array."""
+    return buffer.int_columns(3)
+
+def get_boxes_array(filename):
+    """Load the junction boxes of the puzzle input as an (n, 3) int64 array."""
+    with open_input(filename) as buffer:
+        return load_boxes(buffer).copy()
+
+def squared_distances(boxes, first, second):
+    """Get the squared distances between boxes[first] and boxes[second], elementwise."""
+    diff = boxes[first] - boxes[second]
+    return np.einsum('ij,ij->i', diff, diff)
+
+def cross_ranges(starts_a, sizes_a, starts_b, sizes_b):
+    """Pair every index of range a with every index of range b, for many (a, b) at once.
+
+    Returns:
+        A tuple (first, second) of int64 arrays of indices.
+    """
+    totals = sizes_a * sizes_b
+    owner = np.repeat(np.arange(totals.size), totals)
+    within = np.arange(owner.size) - np.repeat(np.cumsum(totals) - totals, totals)
+    first = starts_a[owner] + within // sizes_b[owner]
+    second = starts_b[owner] + within % sizes_b[owner]
+
+    return first, second
+
+def edges_in_band(boxes, low, high):
+    """Get every pair of boxes with low < squared distance <= high.
+
+    Args:
+        boxes (ndarray): An (n, 3) int64 array of box coordinates.
+        low (int): Exclusive lower bound of the squared distance, -1 for no bound.
+        high (int): Inclusive upper bound of the squared distance.
+
+    Returns:
+        A tuple (dist2, first, second) of int64 arrays sorted by (dist2, first,
+        second), with first < second.
+    """
+    span = int((boxes.max(axis=0) - boxes.min(axis=0)).max()) + 1
+    cell_size = max(math.isqrt(high) + 1, -(-span // MAX_CELLS_PER_AXIS), 1)
+    cells = boxes // cell_size
+    cells -= cells.min(axis=0) - 1  # Leave an empty layer around, so neighbor keys never wrap
+    dims = cells.max(axis=0) + 2
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+    order = np.argsort(keys, kind='stable')
+    cell_keys, cell_starts, cell_sizes = np.unique(keys[order], return_index=True, return_counts=True)
+
+    found_dist2, found_first, found_second = [], [], []
+    for d_x, d_y, d_z in FORWARD_CELL_OFFSETS:
+        neighbor_keys = cell_keys + (d_x * dims[1] + d_y) * dims[2] + d_z
+        idx = np.minimum(np.searchsorted(cell_keys, neighbor_keys), cell_keys.size - 1)
+        has_neighbor = cell_keys[idx] == neighbor_keys
+        first, second = cross_ranges(
+            cell_starts[has_neighbor], cell_sizes[has_neighbor],
+            cell_starts[idx[has_neighbor]], cell_sizes[idx[has_neighbor]])
+        if (d_x, d_y, d_z) == (0, 0, 0):
+            # Both ends in the same cell, take each pair of its boxes once
+            keep = first < second
+            first, second = first[keep], second[keep]
+        first, second = order[first], order[second]
+        first, second = np.minimum(first, second), np.maximum(first, second)
+
+        dist2 = squared_distances(boxes, first, second)
+        in_band = (dist2 > low) & (dist2 <= high)
+        found_dist2.append(dist2[in_band])
+        found_first.append(first[in_band])
+        found_second.append(second[in_band])
+
+    dist2, first, second = (np.concatenate(parts) for parts in (found_dist2, found_first, found_second))
+    by_distance = np.lexsort((second, first, dist2))
+
+    return dist2[by_distance], first[by_distance], second[by_distance]
+
+def first_band_radius(boxes, num_edges):
+    """Estimate the radius within which about num_edges pairs of boxes lie, if spread evenly."""
+    extent = (boxes.max(axis=0) - boxes.min(axis=0) + 1).astype(float)
+    num_boxes = boxes.shape[0]
+    num_pairs = num_boxes * (num_boxes - 1) / 2
+    ball_volume = num_edges / max(num_pairs, 1) * float(np.prod(extent))
+    return max(1, math.ceil((ball_volume * 3 / (4 * math.pi)) ** (1 / 3)))
+
+def iter_edge_bands(boxes, first_band_edges=FIRST_BAND_EDGES, growth=BAND_GROWTH):
+    """Yield the edges between boxes in distance bands of increasing radius.
+
+    Args:
+        boxes (ndarray): An (n, 3) int64 array of box coordinates.
+        first_band_edges (int): About how many edges the first band should hold.
+        growth (float): Factor the radius grows by from one band to the next.
+
+    Yields:
+        Tuples (dist2, first, second) of sorted int64 arrays, see edges_in_band.
+        Together the bands hold every pair exactly once, in increasing distance.
+    """
+    if boxes.shape[0] < 2:
+        return
+
+    max_dist2 = int(((boxes.max(axis=0) - boxes.min(axis=0)) ** 2).sum())
+    radius = first_band_radius(boxes, first_band_edges)
+    low = -1
+    while low < max_dist2:
+        high = min(radius * radius, max_dist2)
+        band = edges_in_band(boxes, low, high)
+        if band[0].size:
+            yield band
+        low = high
+        radius = max(radius + 1, math.ceil(radius * growth))
+
+def iter_edges_by_distance(boxes, first_band_edges=FIRST_BAND_EDGES):
+    """Yield (dist2, i, j) for every pair of boxes i < j, shortest first.
+
+    Edges of the same length come in (i, j) order. Only the distance bands
+    reached by the caller are ever searched.
+    """
+    for dist2, first, second in iter_edge_bands(boxes, first_band_edges):
+        yield from zip(dist2.tolist(), first.tolist(), second.tolist())
+
+def squared_distance_tile(boxes, row_start, row_end, col_start, col_end):
+    """Get the squared distances between two slices of boxes as a 2d int64 array."""
+    rows, cols = boxes[row_start:row_end], boxes[col_start:col_end]
+    tile = np.zeros((rows.shape[0], cols.shape[0]), dtype=np.int64)
+    for axis in range(boxes.shape[1]):
+        diff = rows[:, axis, None] - cols[None, :, axis]
+        tile += diff * diff
+
+    return tile
+
+def keep_smallest(dist2, first, second, k):
+    """Keep the k shortest edges, and every edge tied with the k-th, unsorted."""
+    if dist2.size <= k:
+        return dist2, first, second
+
+    kth = dist2[np.argpartition(dist2, k - 1)[k - 1]]
+    keep = dist2 <= kth
+    return dist2[keep], first[keep], second[keep]
+
+def block_k_smallest(boxes, row_start, row_end, k, block_size=KERNEL_BLOCK_SIZE):
+    """Get the k shortest edges (i, j), i < j, whose i lies in [row_start, row_end).
+
+    Once k edges are found, a tile only contributes entries no longer than the
+    k-th shortest so far, so most tiles cost one comparison per entry.
+
+    Returns:
+        A tuple (dist2, first, second) of unsorted int64 arrays, see keep_smallest.
+    """
+    num_boxes = boxes.shape[0]
+    best = (np.zeros(0, dtype=np.int64),) * 3
+    bound = NO_EDGE - 1
+    for col_start in range(row_start, num_boxes, block_size):
+        col_end = min(col_start + block_size, num_boxes)
+        tile = squared_distance_tile(boxes, row_start, row_end, col_start, col_end)
+        if col_start < row_end:
+            # The tile crosses the diagonal, drop the pairs with j <= i
+            tile[np.arange(col_start, col_end)[None, :] <= np.arange(row_start, row_end)[:, None]] = NO_EDGE
+
+        flat = np.flatnonzero(tile <= bound)
+        if not flat.size:
+            continue
+        width = col_end - col_start
+        found = (tile.ravel()[flat], row_start + flat // width, col_start + flat % width)
+        best = keep_smallest(*(np.concatenate(pair) for pair in zip(best, found)), k)
+        if best[0].size >= k:
+            bound = int(best[0].max())
+
+    return best
+
+def k_smallest_edges(boxes, k, block_size=KERNEL_BLOCK_SIZE, workers=1):
+    """Get the k shortest edges between boxes with a blockwise dense kernel.
+
+    Squared distances are computed one block_size x block_size tile at a time,
+    so memory stays bounded whatever the number of boxes.
+
+    Args:
+        boxes (ndarray): An (n, 3) int64 array of box coordinates.
+        k (int): Number of edges to return.
+        block_size (int): Rows and columns of one tile.
+        workers (int): Number of worker processes, 1 runs everything in this process.
+
+    Returns:
+        A tuple (dist2, first, second) of int64 arrays of the k shortest edges,
+        sorted by (dist2, first, second) like iter_edges_by_distance.
+    """
+    num_boxes = boxes.shape[0]
+    tasks = [
+        (boxes, row_start, min(row_start + block_size, num_boxes), k, block_size)
+        for row_start in range(0, num_boxes, block_size)
+    ]
+    blocks = run_tasks(block_k_smallest, tasks, workers)
+
+    empty = [np.zeros(0, dtype=np.int64)]
+    dist2, first, second = (np.concatenate(empty + [block[i] for block in blocks]) for i in range(3))
+    dist2, first, second = keep_smallest(dist2, first, second, k)
+    by_distance = np.lexsort((second, first, dist2))[:k]
+
+    return dist2[by_distance], first[by_distance], second[by_distance]
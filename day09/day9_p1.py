@@ -1,37 +1,10 @@
 import heapq
 import math
 import os
+import sys
 
-demo_mode = int(os.getenv('demo'))
-
-def get_lines(filename):
-    demo_filename = 'demo.txt'
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        else:
-            with open(demo_filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        
-        return lines
-    except Exception as e:
-        print(f'File read operation exception happened. See details: {e}')
-        return []
-    
-def get_content(filename):
-    demo_filename = 'demo.txt'
-
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                content = file.read()
-        else:
-            with open(demo_filename, 'r') as file:
-                content = file.read()        
-        return content
-    except Exception as e:
-        print(f'file reading error. See details {e}')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.input_loader import get_lines
 
 def get_nodes(lines):
     nodes = []
@@ -58,11 +31,11 @@ def find_largest_area(nodes):
     
     return max_area
 
-lines = get_lines('day9.txt')
-nodes = get_nodes(lines)
-largest_area = find_largest_area(nodes)
-print(f'The largest area is {largest_area}')
-
-
+def main():
+    lines = get_lines('day9.txt')
+    nodes = get_nodes(lines)
+    largest_area = find_largest_area(nodes)
+    print(f'The largest area is {largest_area}')
 
-            
+if __name__ == '__main__':
+    main()
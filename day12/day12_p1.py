@@ -1,37 +1,11 @@
 import numpy as np
 import os
+import sys
 import re
 
-demo_mode = int(os.getenv('demo'))
-
-def get_lines(filename):
-    demo_filename = 'demo.txt'
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        else:
-            with open(demo_filename, 'r') as file:
-                lines = [line.strip() for line in file]
-        
-        return lines
-    except Exception as e:
-        print(f'File read operation exception happened. See details: {e}')
-        return []
-    
-def get_content(filename):
-    demo_filename = 'demo.txt'
-
-    try:
-        if not demo_mode:
-            with open(filename, 'r') as file:
-                content = file.read()
-        else:
-            with open(demo_filename, 'r') as file:
-                content = file.read()        
-        return content
-    except Exception as e:
-        print(f'file reading error. See details {e}')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.bitgrid import BitGrid
+from common.input_loader import get_content
 
 def get_shapes_regions(content):
     """Get shapes and regions from the input file."""
@@ -89,100 +63,121 @@ def get_region_matrix(region_config):
     width, length = region_config
     return [['.' for w in range(width)] for l in range(length)]
 
-def is_valid(num_rows, num_cols, cell):
-    row, col = cell
-    if 0 <= row <= num_rows and 0 <= col <= num_cols:
-        return True
-    return False
-
-def can_fit(start_cell, num_rows, num_cols, empty_cells, shape):
-    r_start_cell, c_start_cell = start_cell
-    num_rows_shape, num_cols_shape = len(shape), len(shape[0])
-    cells_to_be_occupied = set()
-
-    for row in range(num_rows_shape):
-        for col in range(num_cols_shape):
-            n_row, n_col = r_start_cell + row, c_start_cell + col
-            new_cell = n_row, n_col
-            if not is_valid(num_rows, num_cols, new_cell):
-                return (False, None)
-            else:
-                if not new_cell in empty_cells:
-                    return (False, None)
-                cells_to_be_occupied.add(new_cell)
-
-    return (True, cells_to_be_occupied)
+def get_orientations(shape):
+    """Get every distinct rotation and flip of a shape, packed once up front.
+
+    Args:
+        shape (tuple): The rows of the shape, '#' for a filled cell.
+
+    Returns:
+        A list of (bits, first_col) tuples, trimmed to the '#' cells. first_col
+        is the column of the first '#' in the top row, the cell that lands on
+        the cell being filled.
+    """
+    matrix = convert_to_matrix(shape)
+    orientations = []
+    seen = set()
+    for flipped in (matrix, [row[::-1] for row in matrix]):
+        for degree in [0, 90, 180, 270]:
+            rotated = np.array(rotate(flipped, degree) if degree else flipped, dtype=bool)
+            # Trim empty border rows and columns, so the shape can reach the edges of the area
+            rotated = rotated[rotated.any(axis=1)][:, rotated.any(axis=0)]
+            bits = BitGrid.from_array(rotated)
+            key = tuple(bits.rows)
+            if key not in seen:
+                seen.add(key)
+                orientations.append((bits, (bits.rows[0] & -bits.rows[0]).bit_length() - 1))
+
+    return orientations
+
+def can_fit(start_cell, used_cells, shape):
+    """Check if the shape's '#' cells land inside the area on empty cells only.
+
+    Args:
+        start_cell (tuple): The (row, col) of the shape's top-left corner.
+        used_cells (BitGrid): The already used cells of the area.
+        shape (BitGrid): The cells of the shape.
+    """
+    s_row, s_col = start_cell
+    return used_cells.fits(shape, s_row, s_col)
 
 def add_newly_used_cells(used_cells, start_cell, shape):
     """Add newly used cells."""
     s_row, s_col = start_cell
-    occupied_cells = set()
-
-    for row in range(len(shape)):
-        for col in range(len(shape[0])):
-            occupied_cell = s_row + row, s_col + col
-            occupied_cells.add(occupied_cell)
-    
-    used_cells |= occupied_cells
+    used_cells.paste(shape, s_row, s_col)
 
 def remove_newly_used_cells(used_cells, start_cell, shape):
     """Remove newly used cells."""
     s_row, s_col = start_cell
-    occupied_cells = set()
+    used_cells.erase(shape, s_row, s_col)
 
-    for row in range(len(shape)):
-        for col in range(len(shape[0])):
-            occupied_cell = s_row + row, s_col + col
-            occupied_cells.add(occupied_cell)
-    
-    used_cells -= occupied_cells
+def backtrack(presents_left, orientations, areas, used_cells, free_cells, dead_ends):
+    """Use backtrack to see if all shapes can fit.
 
-global_counter = 0
+    The first empty cell (row by row) is either covered by some shape or left
+    empty for good, so every packing is tried exactly once. A branch stops as
+    soon as the presents left need more cells than are still free, or when the
+    same cells and presents were already found not to work.
 
-def backtrack(width, height, presents, curr_presents, all_cells, shapes, used_cells):
-    """Use backtrack to see if all shapes can fit.
-    
     Args:
-        width (int): The width of the area for placing presents.
-        height (int): The height of the area for placing presents.
-        presents (list): The list of presents to be placed in the area.
-        curr_presents (list): The current list of presents already placed in the area.
-        all_cells (list): The 2D list of cells each of which is a tuple (row, col).
-        shapes (list): The list of shapes each of which is a matrix.
-        used_cells (list): The list of already used cells each of which is a tuple (row, col).
+        presents_left (list): How many presents of each shape still have to be placed.
+        orientations (list): The get_orientations result of each shape.
+        areas (list): The number of '#' cells of each shape.
+        used_cells (BitGrid): The already used cells of the area, one bit per cell.
+        free_cells (int): The number of cells neither used nor left empty.
+        dead_ends (set): The (used rows, presents left) states that cannot be completed.
 
     Returns:
         bool: True if all presents can fit in the area, False otherwise.
     """
-    global global_counter 
-    global_counter += 1
-    print(f'global_counter={global_counter}')
-    print(f'presents={presents}')
-    print(f'curr_presents={curr_presents}')
-
-    if set(presents) == set(curr_presents):
+    area_needed = sum(count * area for count, area in zip(presents_left, areas))
+    if area_needed == 0:
         return True
-    
-    presents_left = [total - placed for total, placed in zip(presents, curr_presents)]
-    num_rows, num_cols = height, width 
-    empty_cells = all_cells - used_cells
-    rotate_degrees = [90, 180, 270]
-
-    for start_cell in empty_cells:
-        for i, num_presents in enumerate(presents_left):
-            for j in range(num_presents):
-                for degree in rotate_degrees:
-                    curr_shape = rotate(shapes[i], degree) 
-                    if can_fit(start_cell, num_rows, num_cols, empty_cells, curr_shape):
-                        curr_presents[i] += 1
-                        add_newly_used_cells(used_cells, start_cell, curr_shape)
-                        if backtrack(width, height, presents, curr_presents, all_cells, shapes, used_cells):
-                            return True
-                        remove_newly_used_cells(used_cells, start_cell, curr_shape)
-                        curr_presents[i] -= 1
-
-    return False
-    
+    if area_needed > free_cells:
+        return False
+    state = tuple(used_cells.rows), tuple(presents_left)
+    if state in dead_ends:
+        return False
+
+    row, col = next(used_cells.iter_cells(False))
+    for i, num_presents in enumerate(presents_left):
+        if not num_presents:
+            continue
+        for shape, first_col in orientations[i]:
+            start_cell = row, col - first_col
+            if can_fit(start_cell, used_cells, shape):
+                presents_left[i] -= 1
+                add_newly_used_cells(used_cells, start_cell, shape)
+                fits = backtrack(presents_left, orientations, areas, used_cells, free_cells - areas[i], dead_ends)
+                remove_newly_used_cells(used_cells, start_cell, shape)
+                presents_left[i] += 1
+                if fits:
+                    return True
+
+    # Leave the cell empty
+    used_cells.set(row, col)
+    fits = backtrack(presents_left, orientations, areas, used_cells, free_cells - 1, dead_ends)
+    used_cells.clear(row, col)
+    if not fits:
+        dead_ends.add(state)
+    return fits
+
+def can_fit_presents(width, height, presents, orientations, areas):
+    """Check if all presents fit in a width x height area."""
+    # Shapes come in every orientation, so the area can be turned to fill along its short side
+    num_rows, num_cols = max(width, height), min(width, height)
+    if sum(count * area for count, area in zip(presents, areas)) > num_rows * num_cols:
+        return False
+
+    # Every present fits in its own box the size of the largest shape
+    box_rows = max(bits.num_rows for shape in orientations for bits, _ in shape)
+    box_cols = max(bits.num_cols for shape in orientations for bits, _ in shape)
+    if (num_rows // box_rows) * (num_cols // box_cols) >= sum(presents):
+        return True
+
+    used_cells = BitGrid(num_rows, num_cols)
+    return backtrack(list(presents), orientations, areas, used_cells, num_rows * num_cols, set())
+
 def main():
     content = get_content('day12.txt')
 
@@ -191,16 +186,13 @@ def main():
     # regions example: (((4, 4), (0, 0, 0, 0, 2, 0)), 
     #                  ((12, 5), (1, 0, 1, 0, 2, 2)))
     shapes, regions = get_shapes_regions(content)
+    orientations = [get_orientations(shape) for shape in shapes]
+    areas = [sum(row.count('#') for row in shape) for shape in shapes]
     num_areas_fitting_presents = 0
     for region in regions:
         dimension, presents = region # dimension, i.e., (width, height), example: (4, 4), presents example: (0, 0, 0, 0, 2, 0)
         width, height = dimension
-        num_rows, num_cols = height, width
-        all_cells = set([(row, col) for row in range(num_rows) for col in range(num_cols)])
-        curr_presents = [0 for i in range(len(presents))]
-        used_cells = set()
-        can_fit_presents = backtrack(width, height, presents, curr_presents, all_cells, shapes, used_cells)
-        if can_fit_presents:
+        if can_fit_presents(width, height, presents, orientations, areas):
             num_areas_fitting_presents += 1
     
     print(f'Number of areas fitting all presents for each area: {num_areas_fitting_presents}')
@@ -0,0 +1,205 @@
+"""Run every day/part solver in a process pool and report per-part timings.
+
+Each solver runs in its own worker process (one task per process), so the peak
+RSS reported for a part is that part's own peak.
+
+Examples:
+    python run_all.py
+    python run_all.py --days 1 7 --workers 4
+    python run_all.py --demo --json results.json --csv results.csv
+"""
+import argparse
+import concurrent.futures
+import csv
+import glob
+import json
+import os
+import re
+import resource
+import runpy
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+SOLVER_PATTERN = re.compile(r'^day(\d+)_p(\d+)\.py$')
+RESULT_FIELDS = ['day', 'part', 'status', 'wall_s', 'cpu_s', 'peak_rss_kb', 'answer', 'error']
+
+class LastLineWriter:
+    """A stdout replacement that only keeps the last non-empty line printed."""
+
+    def __init__(self):
+        self.last_line = ''
+        self._pending = ''
+
+    def write(self, text):
+        text = self._pending + text
+        lines = text.split('\n')
+        self._pending = lines.pop()
+        for line in reversed(lines):
+            if line.strip():
+                self.last_line = line.strip()
+                break
+        return len(text)
+
+    def flush(self):
+        if self._pending.strip():
+            self.last_line = self._pending.strip()
+            self._pending = ''
+
+def discover_solvers(days=None):
+    """Find all solvers like day07/day7_p2.py.
+
+    Args:
+        days (list): Only keep these days. All days if empty or None.
+
+    Returns:
+        A sorted list of (day, part, path) tuples.
+    """
+    solvers = []
+    for path in glob.glob(os.path.join(REPO_DIR, 'day*', 'day*_p*.py')):
+        match = SOLVER_PATTERN.match(os.path.basename(path))
+        if not match:
+            continue
+        day, part = int(match.group(1)), int(match.group(2))
+        if days and day not in days:
+            continue
+        solvers.append((day, part, path))
+
+    return sorted(solvers)
+
+def cpu_seconds():
+    """CPU time used by this process and any pools it has started."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+def run_solver(day, part, path, input_dir=None):
+    """Run one solver as __main__ in the current process and measure it.
+
+    Args:
+        day (int): The day number.
+        part (int): The part number.
+        path (str): Path of the solver script.
+        input_dir (str): Directory holding the dayN.txt input. Defaults to the solver's directory.
+
+    Returns:
+        A dict with the fields in RESULT_FIELDS.
+    """
+    solver_dir = os.path.dirname(path)
+    os.chdir(input_dir or solver_dir)
+    sys.path.insert(0, solver_dir)
+    sys.argv = [path]
+
+    stdout = LastLineWriter()
+    real_stdout = sys.stdout
+    status, error = 'ok', ''
+    wall_start, cpu_start = time.perf_counter(), cpu_seconds()
+    sys.stdout = stdout
+    try:
+        runpy.run_path(path, run_name='__main__')
+    except BaseException as e:  # A solver calling exit() must not take the worker down
+        status, error = 'error', f'{type(e).__name__}: {e}'
+    finally:
+        sys.stdout = real_stdout
+        stdout.flush()
+    wall, cpu = time.perf_counter() - wall_start, cpu_seconds() - cpu_start
+
+    return {
+        'day': day,
+        'part': part,
+        'status': status,
+        'wall_s': round(wall, 6),
+        'cpu_s': round(cpu, 6),
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'answer': stdout.last_line,
+        'error': error,
+    }
+
+def stop_workers(executor):
+    """Kill the worker processes of an executor, including solvers still running."""
+    # ProcessPoolExecutor has no public way to stop a running task before Python 3.14
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=True, cancel_futures=True)
+
+def run_solvers(tasks, workers=None, timeout=None):
+    """Run solvers across a process pool.
+
+    The workers are not daemonic, so a solver can start its own process pool
+    (workers=N in the environment).
+
+    Args:
+        tasks (list): A list of (day, part, path, input_dir) tuples.
+        workers (int): Number of worker processes. Defaults to the number of cores.
+        timeout (float): Seconds to wait for the whole run before marking unfinished parts 'timeout'.
+
+    Returns:
+        A list of result dicts in the same order as tasks.
+    """
+    results = []
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers or os.cpu_count(), max_tasks_per_child=1)
+    try:
+        pending = [(task, executor.submit(run_solver, *task)) for task in tasks]
+        deadline = time.monotonic() + timeout if timeout else None
+        for (day, part, path, input_dir), future in pending:
+            remaining = max(deadline - time.monotonic(), 0) if deadline else None
+            try:
+                results.append(future.result(remaining))
+            except concurrent.futures.TimeoutError:
+                results.append({
+                    'day': day, 'part': part, 'status': 'timeout', 'wall_s': None,
+                    'cpu_s': None, 'peak_rss_kb': None, 'answer': '', 'error': '',
+                })
+            except concurrent.futures.process.BrokenProcessPool as e:
+                # The worker died, e.g. killed for memory, without returning a result
+                results.append({
+                    'day': day, 'part': part, 'status': 'error', 'wall_s': None,
+                    'cpu_s': None, 'peak_rss_kb': None, 'answer': '', 'error': f'{type(e).__name__}: {e}',
+                })
+    finally:
+        stop_workers(executor)
+
+    return results
+
+def print_results(results):
+    print(f'{"day":>3} {"part":>4} {"status":>7} {"wall_s":>10} {"cpu_s":>10} {"peak_rss_kb":>12}  answer')
+    for result in results:
+        wall = '-' if result['wall_s'] is None else f'{result["wall_s"]:.4f}'
+        cpu = '-' if result['cpu_s'] is None else f'{result["cpu_s"]:.4f}'
+        rss = '-' if result['peak_rss_kb'] is None else str(result['peak_rss_kb'])
+        answer = result['answer'] if result['status'] == 'ok' else result['error']
+        print(f'{result["day"]:>3} {result["part"]:>4} {result["status"]:>7} {wall:>10} {cpu:>10} {rss:>12}  {answer}')
+
+def write_json(results, filename):
+    with open(filename, 'w') as file:
+        json.dump(results, file, indent=2)
+
+def write_csv(results, filename):
+    with open(filename, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+def main():
+    parser = argparse.ArgumentParser(description='Run all Advent of Code solvers and time them.')
+    parser.add_argument('--days', type=int, nargs='*', help='Days to run, e.g. --days 1 7. Default: all')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes. Default: number of cores')
+    parser.add_argument('--timeout', type=float, default=None, help='Seconds to wait for the whole run')
+    parser.add_argument('--demo', action='store_true', help='Run against demo.txt in each day directory')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    parser.add_argument('--csv', help='Write the results to this CSV file')
+    args = parser.parse_args()
+
+    if args.demo:
+        os.environ['demo'] = '1'
+
+    tasks = [(day, part, path, None) for day, part, path in discover_solvers(args.days)]
+    results = run_solvers(tasks, args.workers, args.timeout)
+    print_results(results)
+
+    if args.json:
+        write_json(results, args.json)
+    if args.csv:
+        write_csv(results, args.csv)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Brute-force checks of the day01 dial engine."""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'day01'))
+from day1_dial import count_zeros, count_zeros_streaming, simulate_dials
+
+def click_by_click(steps, start_num, dial_size):
+    """Turn the dial one click at a time, the slow way."""
+    num, landings, passes = start_num % dial_size, 0, 0
+    for step in steps:
+        for _ in range(abs(step)):
+            num = (num + (1 if step > 0 else -1)) % dial_size
+            passes += num == 0
+        landings += num == 0
+
+    return landings, passes, num
+
+def random_steps(rng, num_steps, max_step):
+    return rng.integers(-max_step, max_step + 1, size=num_steps).astype(np.int64)
+
+@pytest.mark.parametrize('seed', range(10))
+def test_count_zeros_matches_clicks(seed):
+    rng = np.random.default_rng(seed)
+    for dial_size in (1, 2, 7, 100):
+        steps = random_steps(rng, int(rng.integers(0, 60)), 3 * dial_size)
+        start_num = int(rng.integers(0, dial_size))
+        assert count_zeros(steps, start_num, dial_size) == click_by_click(steps.tolist(), start_num, dial_size)
+
+def test_count_zeros_streaming_matches_clicks(tmp_path):
+    steps = random_steps(np.random.default_rng(0), 500, 350)
+    path = tmp_path / 'day1.txt'
+    path.write_text(''.join(f'{"L" if step < 0 else "R"}{abs(step)}\n' for step in steps.tolist()))
+
+    landings, passes, num = click_by_click(steps.tolist(), 50, 100)
+    for chunk_lines in (1, 7, 1 << 20):
+        dial = count_zeros_streaming(str(path), 50, chunk_lines=chunk_lines)
+        assert (dial.landings, dial.passes, dial.num) == (landings, passes, num)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_simulate_dials_matches_clicks(seed):
+    rng = np.random.default_rng(seed)
+    steps = random_steps(rng, 40, 250)
+    dial_sizes = rng.integers(1, 120, size=30)
+    start_nums = rng.integers(0, 1000, size=30)
+    expected = [click_by_click(steps.tolist(), int(start), int(size))[:2] for start, size in zip(start_nums, dial_sizes)]
+
+    for block_cells in (1, 17, 1 << 22):
+        landings, passes = simulate_dials(steps, start_nums, dial_sizes, block_cells=block_cells)
+        assert list(zip(landings.tolist(), passes.tolist())) == expected
+
+def test_simulate_dials_shares_one_size():
+    steps = random_steps(np.random.default_rng(1), 50, 300)
+    landings, passes = simulate_dials(steps, np.arange(100))
+    assert list(zip(landings.tolist(), passes.tolist())) == [click_by_click(steps.tolist(), start, 100)[:2] for start in range(100)]
@@ -0,0 +1,66 @@
+"""Brute-force checks of the day02 invalid ID arithmetic."""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'day02'))
+from day2_invalid_ids import iter_invalid_ids, sum_invalid_ids, total_invalid_id_sum
+
+REPEAT_COUNT_CHOICES = [(2,), (3,), (2, 3), None]
+
+def is_invalid(id_int, repeat_counts):
+    """Check an ID by trying every block length, the slow way."""
+    digits = str(id_int)
+    num_digits = len(digits)
+    for block_len in range(1, num_digits):
+        repeats = num_digits // block_len
+        if num_digits % block_len or (repeat_counts is not None and repeats not in repeat_counts):
+            continue
+        if digits[:block_len] * repeats == digits:
+            return True
+    return False
+
+def invalid_ids(start, end, repeat_counts):
+    return [id_int for id_int in range(start, end + 1) if is_invalid(id_int, repeat_counts)]
+
+def random_ranges(rng, num_ranges):
+    ranges = []
+    for _ in range(num_ranges):
+        start = rng.randrange(0, 10 ** rng.randint(1, 7))
+        ranges.append((start, start + rng.randrange(0, 30000)))
+    return ranges
+
+@pytest.mark.parametrize('repeat_counts', REPEAT_COUNT_CHOICES)
+@pytest.mark.parametrize('seed', range(5))
+def test_invalid_ids_match_brute_force(repeat_counts, seed):
+    rng = random.Random(seed)
+    for start, end in random_ranges(rng, 10) + [(0, 0), (1, 9), (10, 11), (999990, 1000100)]:
+        expected = invalid_ids(start, end, repeat_counts)
+        assert list(iter_invalid_ids(start, end, repeat_counts)) == expected
+        assert sum_invalid_ids(start, end, repeat_counts) == sum(expected)
+
+def test_whole_digit_lengths():
+    # Every ID with up to 8 digits, built by repeating every seed, so the overlaps are hit
+    for repeat_counts in REPEAT_COUNT_CHOICES:
+        expected = set()
+        for num_digits in range(1, 9):
+            for block_len in range(1, num_digits):
+                repeats = num_digits // block_len
+                if num_digits % block_len or (repeat_counts is not None and repeats not in repeat_counts):
+                    continue
+                expected.update(int(str(seed) * repeats) for seed in range(10 ** (block_len - 1), 10 ** block_len))
+        assert sum_invalid_ids(1, 10 ** 8 - 1, repeat_counts) == sum(expected)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_total_merges_overlaps_and_chunks(workers):
+    rng = random.Random(7)
+    ranges = random_ranges(rng, 6)
+    ranges += [(ranges[0][0] + 5, ranges[0][1] + 500), ranges[1]]
+    expected = set()
+    for start, end in ranges:
+        expected.update(invalid_ids(start, end, None))
+
+    for chunk_size in (1, 97, 10 ** 12):
+        assert total_invalid_id_sum(ranges, None, workers, chunk_size) == sum(expected)
@@ -0,0 +1,66 @@
+"""Brute-force checks of the day04 neighbor counts and roll peeling."""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'day04'))
+from common.bitgrid import BitGrid
+from day4_grid import (NEIGHBOR_OFFSETS, accessible_rolls, add_bit_slices, bit_slices_below,
+                       count_accessible_bits, neighbor_counts, peel_rolls)
+
+def slow_neighbor_counts(rolls):
+    num_rows, num_cols = rolls.shape
+    counts = np.zeros(rolls.shape, dtype=int)
+    for row in range(num_rows):
+        for col in range(num_cols):
+            for d_row, d_col in NEIGHBOR_OFFSETS:
+                if 0 <= row + d_row < num_rows and 0 <= col + d_col < num_cols:
+                    counts[row, col] += rolls[row + d_row, col + d_col]
+    return counts
+
+def random_grids(seed, count=20):
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        shape = tuple(int(n) for n in rng.integers(1, 40, size=2))
+        yield rng.random(shape) < rng.random()
+
+@pytest.mark.parametrize('seed', range(3))
+def test_neighbor_counts(seed):
+    for rolls in random_grids(seed):
+        assert (neighbor_counts(rolls) == slow_neighbor_counts(rolls)).all()
+
+@pytest.mark.parametrize('threshold', [1, 3, 4, 5, 8, 9])
+def test_count_accessible_bits(threshold):
+    for rolls in random_grids(threshold):
+        expected = int((rolls & (slow_neighbor_counts(rolls) < threshold)).sum())
+        assert count_accessible_bits(BitGrid.from_array(rolls), threshold) == expected
+
+def test_bit_slices_count_every_column():
+    rng = np.random.default_rng(0)
+    num_cols = 70
+    mask = (1 << num_cols) - 1
+    for _ in range(50):
+        counter, counts = [], np.zeros(num_cols, dtype=int)
+        for _ in range(int(rng.integers(0, 20))):
+            bits = rng.random(num_cols) < 0.5
+            add_bit_slices(counter, sum(1 << col for col in np.flatnonzero(bits).tolist()))
+            counts += bits
+        for threshold in range(0, 22):
+            below = bit_slices_below(counter, threshold, mask)
+            assert [(below >> col) & 1 == 1 for col in range(num_cols)] == (counts < threshold).tolist()
+
+@pytest.mark.parametrize('seed', range(3))
+def test_peel_rolls_matches_rescan(seed):
+    for rolls in random_grids(seed):
+        remaining, round_counts = rolls.copy(), []
+        while True:
+            removed = accessible_rolls(remaining)
+            if not removed.any():
+                break
+            round_counts.append(int(removed.sum()))
+            remaining &= ~removed
+
+        assert peel_rolls(rolls, track_rounds=True) == (sum(round_counts), round_counts)
@@ -0,0 +1,66 @@
+"""Brute-force checks of the day05 fresh ID ranges."""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'day05'))
+from day5_intervals import IntervalIndex, IntervalSet, count_fresh_ids_streaming
+
+def write_input(path, fresh_id_ranges, ids):
+    lines = [f'{start}-{end}' for start, end in fresh_id_ranges] + [''] + [str(id_int) for id_int in ids]
+    path.write_text('\n'.join(lines) + '\n')
+
+@pytest.mark.parametrize('seed', range(5))
+def test_count_fresh_ids_streaming(tmp_path, seed):
+    rng = random.Random(seed)
+    fresh_id_ranges = [(start, start + rng.randrange(0, 50)) for start in (rng.randrange(0, 1000) for _ in range(20))]
+    ids = [rng.randrange(0, 1100) for _ in range(500)]
+    write_input(tmp_path / 'day5.txt', fresh_id_ranges, ids)
+
+    fresh = [id_int for id_int in ids if any(start <= id_int <= end for start, end in fresh_id_ranges)]
+    for chunk_bytes in (3, 64, 1 << 20):
+        path = str(tmp_path / 'day5.txt')
+        assert count_fresh_ids_streaming(path, chunk_bytes=chunk_bytes) == len(set(fresh))
+        assert count_fresh_ids_streaming(path, distinct=False, chunk_bytes=chunk_bytes) == len(fresh)
+
+def check_interval_set(intervals, ids, universe):
+    ranges = list(intervals)
+    # Disjoint, sorted and not touching, or two ranges should have been coalesced
+    assert all(start <= end for start, end in ranges)
+    assert all(end + 1 < next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    assert set().union(*(range(start, end + 1) for start, end in ranges)) == ids
+    assert intervals.count_fresh_ids() == len(ids)
+    assert [id_int in intervals for id_int in universe] == [id_int in ids for id_int in universe]
+
+@pytest.mark.parametrize('seed', range(20))
+def test_interval_set_matches_set(seed):
+    rng = random.Random(seed)
+    universe = range(-5, 130)
+    intervals, ids = IntervalSet(), set()
+    for _ in range(200):
+        start = rng.randrange(0, 120)
+        end = start + rng.randrange(-2, 15)
+        if rng.random() < 0.6:
+            intervals.add(start, end)
+            ids.update(range(start, end + 1))
+        else:
+            intervals.remove(start, end)
+            ids.difference_update(range(start, end + 1))
+        check_interval_set(intervals, ids, universe)
+
+        low = rng.randrange(-5, 125)
+        high = low + rng.randrange(0, 10)
+        assert intervals.overlaps(low, high) == any(low <= id_int <= high for id_int in ids)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_interval_index_matches_ranges(seed):
+    rng = random.Random(seed)
+    fresh_id_ranges = [(start, start + rng.randrange(0, 20)) for start in (rng.randrange(0, 300) for _ in range(30))]
+    index = IntervalIndex(fresh_id_ranges)
+    ids = list(range(-5, 330))
+    expected = [any(start <= id_int <= end for start, end in fresh_id_ranges) for id_int in ids]
+    assert [id_int in index for id_int in ids] == expected
+    assert index.contains_many(ids).tolist() == expected
+    check_interval_set(IntervalSet(fresh_id_ranges), {i for i, fresh in zip(ids, expected) if fresh}, ids)
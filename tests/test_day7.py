@@ -0,0 +1,68 @@
+"""Brute-force checks of the day07 beam sweeps."""
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'day07'))
+from common.bitgrid import BitGrid
+from day7_beams import BeamHistory, count_splits_bits, sweep_manifold
+
+def row_by_row(splitters, start):
+    """The timeline count of every cell and the number of splits, one cell at a time."""
+    num_rows, num_cols = splitters.shape
+    start_row, start_col = start
+    counts = [[0] * num_cols for _ in range(num_rows)]
+    counts[start_row][start_col] = 1
+    split_times = 0
+    for row in range(start_row + 1, num_rows):
+        for col, count in enumerate(counts[row - 1]):
+            if not count:
+                continue
+            if splitters[row, col]:
+                split_times += 1
+                for next_col in (col - 1, col + 1):
+                    if 0 <= next_col < num_cols:
+                        counts[row][next_col] += count
+            else:
+                counts[row][col] += count
+
+    return counts, split_times
+
+def random_manifold(rng):
+    num_rows, num_cols = rng.randint(1, 30), rng.randint(1, 20)
+    splitters = np.array([[rng.random() < 0.3 for _ in range(num_cols)] for _ in range(num_rows)], dtype=bool)
+    start = rng.randrange(num_rows), rng.randrange(num_cols)
+    splitters[start] = False
+    return splitters, start
+
+@pytest.mark.parametrize('seed', range(20))
+def test_sweeps_match_row_by_row(seed):
+    splitters, start = random_manifold(random.Random(seed))
+    counts, split_times = row_by_row(splitters, start)
+
+    sweep = sweep_manifold(splitters, start)
+    assert (sweep.split_times, sweep.timelines()) == (split_times, sum(counts[-1]))
+    assert count_splits_bits(BitGrid.from_array(splitters), start) == split_times
+
+@pytest.mark.parametrize('checkpoint_every', [1, 3, 7, 100])
+@pytest.mark.parametrize('seed', range(10))
+def test_beam_history_counts_at(seed, checkpoint_every):
+    rng = random.Random(seed)
+    splitters, start = random_manifold(rng)
+    counts, split_times = row_by_row(splitters, start)
+    history = BeamHistory(splitters, start, checkpoint_every)
+    assert (history.split_times, history.num_timelines) == (split_times, sum(counts[-1]))
+
+    # Walk down, then jump around, so both the cached and the fresh replays are hit
+    rows = list(range(history.num_rows)) + [rng.randrange(history.num_rows) for _ in range(30)]
+    for row in rows:
+        assert [int(count) for count in history.counts_at(row)] == counts[row]
+        col = rng.randrange(history.num_cols)
+        assert history.timelines_at(row, col) == counts[row][col]
+
+    with pytest.raises(IndexError):
+        history.counts_at(history.num_rows)
@@ -0,0 +1,121 @@
+"""Brute-force checks of the day08 edge generators and circuit model."""
+import heapq
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'day08'))
+from day8_circuits import CircuitModel, DisjointSet, connect_shortest, prim_mst
+from day8_edges import iter_edges_by_distance, k_smallest_edges
+
+def all_edges(boxes, ids=None):
+    """Every (dist2, i, j) with i < j, sorted, the slow way."""
+    if ids is None:
+        ids = range(len(boxes))
+    ids = list(ids)
+    edges = []
+    for a in range(len(ids)):
+        for b in range(a + 1, len(ids)):
+            i, j = ids[a], ids[b]
+            diff = boxes[i] - boxes[j]
+            edges.append((int(diff @ diff), i, j))
+
+    return sorted(edges)
+
+def circuit_sizes(num_boxes, edges, ids=None):
+    """Sizes of the circuits after connecting the given edges, the slow way."""
+    circuit = {node: {node} for node in (range(num_boxes) if ids is None else ids)}
+    for _, i, j in edges:
+        if circuit[i] is not circuit[j]:
+            merged = circuit[i] | circuit[j]
+            for node in merged:
+                circuit[node] = merged
+
+    return sorted(len(members) for members in {id(c): c for c in circuit.values()}.values())
+
+def mst_weights(edges, ids):
+    """Sorted squared lengths of a minimum spanning tree, with Kruskal over every edge."""
+    circuits = DisjointSet(max(ids) + 1 if ids else 0)
+    return sorted(dist2 for dist2, i, j in edges if circuits.union(i, j))
+
+def random_boxes(rng, kind, num_boxes):
+    if kind == 'uniform':
+        return rng.integers(0, 1000, size=(num_boxes, 3))
+    if kind == 'clustered':
+        centers = rng.integers(0, 100000, size=(3, 3))
+        return centers[rng.integers(0, 3, size=num_boxes)] + rng.integers(-20, 20, size=(num_boxes, 3))
+    if kind == 'duplicates':
+        return rng.integers(0, 4, size=(num_boxes, 3))
+    if kind == 'line':
+        boxes = np.zeros((num_boxes, 3), dtype=np.int64)
+        boxes[:, 1] = rng.integers(-500, 500, size=num_boxes)
+        return boxes
+    raise ValueError(kind)
+
+KINDS = ['uniform', 'clustered', 'duplicates', 'line']
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('seed', range(5))
+def test_iter_edges_by_distance_matches_all_pairs(kind, seed):
+    rng = np.random.default_rng(seed)
+    boxes = random_boxes(rng, kind, int(rng.integers(2, 120))).astype(np.int64)
+    for first_band_edges in (1, 7, 1024):
+        assert list(iter_edges_by_distance(boxes, first_band_edges)) == all_edges(boxes)
+
+@pytest.mark.parametrize('num_boxes', [0, 1, 2])
+def test_iter_edges_by_distance_tiny(num_boxes):
+    boxes = np.arange(3 * num_boxes, dtype=np.int64).reshape(num_boxes, 3)
+    assert list(iter_edges_by_distance(boxes)) == all_edges(boxes)
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('seed', range(5))
+def test_k_smallest_edges_matches_all_pairs(kind, seed):
+    rng = np.random.default_rng(seed)
+    boxes = random_boxes(rng, kind, int(rng.integers(2, 150))).astype(np.int64)
+    expected = all_edges(boxes)
+    for k in (1, 10, len(expected) + 5):
+        for block_size in (7, 64, 1024):
+            dist2, first, second = k_smallest_edges(boxes, k, block_size=block_size)
+            assert list(zip(dist2.tolist(), first.tolist(), second.tolist())) == expected[:k]
+
+def test_k_smallest_edges_on_a_pool():
+    boxes = np.random.default_rng(0).integers(0, 1000, size=(300, 3))
+    dist2, first, second = k_smallest_edges(boxes, 50, block_size=64, workers=2)
+    assert list(zip(dist2.tolist(), first.tolist(), second.tolist())) == all_edges(boxes)[:50]
+
+@pytest.mark.parametrize('method', ['grid', 'dense'])
+def test_connect_shortest_circuit_sizes(method):
+    boxes = np.random.default_rng(1).integers(0, 1000, size=(200, 3))
+    circuits = connect_shortest(boxes, 150, method=method)
+    assert sorted(circuits.component_sizes()) == circuit_sizes(200, all_edges(boxes)[:150])
+
+@pytest.mark.parametrize('seed', range(5))
+def test_prim_mst_matches_kruskal(seed):
+    boxes = np.random.default_rng(seed).integers(0, 1000, size=(80, 3))
+    mst_edges, _ = prim_mst(boxes)
+    edges = all_edges(boxes)
+    assert sorted(dist2 for dist2, _, _ in mst_edges) == mst_weights(edges, list(range(80)))
+
+@pytest.mark.parametrize('seed', range(5))
+def test_circuit_model_matches_rebuild(seed):
+    rng = np.random.default_rng(seed)
+    num_connections = 30
+    model = CircuitModel(rng.integers(0, 1000, size=(40, 3)), num_connections)
+    for _ in range(30):
+        if len(model) > 2 and rng.random() < 0.3:
+            model.remove_box(int(rng.choice(model.box_ids())))
+        else:
+            model.add_box(rng.integers(0, 1000, size=3))
+
+        ids = model.box_ids().tolist()
+        boxes = {box_id: model.box(box_id) for box_id in ids}
+        edges = all_edges(boxes, ids)
+        assert model.shortest_edges == edges[:num_connections]
+        assert sorted(dist2 for dist2, _, _ in model.mst_edges) == mst_weights(edges, ids)
+        node1, node2 = model.joining_edge()
+        diff = boxes[node1] - boxes[node2]
+        assert int(diff @ diff) == max(mst_weights(edges, ids))
+        assert sorted(model.component_sizes()) == circuit_sizes(None, edges[:num_connections], ids)
+        assert model.top_sizes(3) == heapq.nlargest(3, circuit_sizes(None, edges[:num_connections], ids))
@@ -0,0 +1,23 @@
+"""Checks of the shared process pool helper."""
+import multiprocessing
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.pool import run_tasks
+
+def add(a, b):
+    return a + b
+
+def run_nested(workers):
+    return run_tasks(add, [(i, i) for i in range(10)], workers)
+
+def test_results_keep_task_order():
+    tasks = [(i, 10 * i) for i in range(50)]
+    expected = [a + b for a, b in tasks]
+    for workers in (1, 2, 3):
+        assert run_tasks(add, tasks, workers) == expected
+
+def test_daemonic_process_falls_back_to_serial():
+    with multiprocessing.Pool(1) as pool:
+        assert pool.apply(run_nested, (2,)) == [2 * i for i in range(10)]
@@ -0,0 +1,38 @@
+"""Checks of the run_all.py runner."""
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from benchmarks.generators import GENERATORS
+import run_all
+
+def write_input(tmp_path, day):
+    with open(tmp_path / f'day{day}.txt', 'wb') as file:
+        file.write(GENERATORS[day](1))
+
+def test_solver_pools_run_inside_the_runner(tmp_path, monkeypatch):
+    # workers=2 makes days 2 and 6 start their own process pools
+    tasks = []
+    for day in (2, 6):
+        day_dir = tmp_path / f'day{day}'
+        day_dir.mkdir()
+        write_input(day_dir, day)
+        tasks += [(d, part, path, str(day_dir)) for d, part, path in run_all.discover_solvers([day])]
+
+    serial = run_all.run_solvers(tasks, workers=2)
+    monkeypatch.setenv('workers', '2')
+    pooled = run_all.run_solvers(tasks, workers=2)
+
+    assert [result['status'] for result in pooled] == ['ok'] * len(tasks), [result['error'] for result in pooled]
+    assert [result['answer'] for result in pooled] == [result['answer'] for result in serial]
+
+def test_timeout_stops_a_hung_solver(tmp_path):
+    solver = tmp_path / 'day99_p1.py'
+    solver.write_text('import time\ntime.sleep(600)\n')
+    quick = tmp_path / 'day99_p2.py'
+    quick.write_text('print(42)\n')
+
+    results = run_all.run_solvers([(99, 1, str(solver), None), (99, 2, str(quick), None)], workers=2, timeout=3)
+
+    assert [result['status'] for result in results] == ['timeout', 'ok']
+    assert results[1]['answer'] == '42'